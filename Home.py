@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
 import datetime
 import plotly.express as px
-from data.dummy_data import inventory_logs
+from core.resources import get_ledger_store, get_pending_queue
+from core.debug import page_profiler, render_debug_panel
 
 # 📅 날짜
 today = datetime.date.today()
@@ -11,6 +11,7 @@ today = datetime.date.today()
 # 헤더 및 소개
 # -----------------------------
 st.set_page_config(page_title="🏭 ERP 홈 대시보드", layout="wide")
+profiler = page_profiler("Home")
 st.title("visionerp")
 st.markdown("""
 이 시스템은 소규모 유통기업을 위한 ERP입니다.
@@ -46,33 +47,22 @@ else:
 # -----------------------------
 # KPI 지표 계산 (수정 반영)
 # -----------------------------
-df = inventory_logs.copy()
-df["날짜"] = pd.to_datetime(df["날짜"])
-df["월"] = df["날짜"].dt.to_period("M").astype(str)
-
-# 숫자형 변환
-df["입고단가"] = pd.to_numeric(df["입고단가"], errors="coerce").fillna(0)
-df["출고단가"] = pd.to_numeric(df["출고단가"], errors="coerce").fillna(0)
-df["수량"] = pd.to_numeric(df["수량"], errors="coerce").fillna(0)
-
-# 오늘/이번달 필터
+# 공용 원장의 KPI 집계 (입출고 등록 시 증분 갱신)
+with profiler.section("원장 로드", cached=True):
+    ledger = get_ledger_store()
 today = datetime.date.today()
-df_today = df[df["날짜"].dt.date == today]
 current_month = today.strftime("%Y-%m")
-df_month = df[df["월"] == current_month]
-
-# KPI 계산
-raw_materials = df["납품업체명"].nunique()
-finished_goods = df["품목명"].nunique()
-monthly_sales_count = df_month[df_month["구분"] == "출고"].shape[0]
-monthly_sales_amount = (
-    df_month[df_month["구분"] == "출고"]
-    .eval("출고단가 * 수량")
-    .sum()
-)
+with profiler.section("KPI 집계", cached=True):
+    kpi = ledger.kpi_summary(current_month)
+
+raw_materials = kpi["거래처"]
+finished_goods = kpi["상품"]
+monthly_sales_count = kpi["판매건수"]
+monthly_sales_amount = kpi["매출"]
 
-# 대기 항목은 임시 값 유지
-pending_io = {"입고": 2, "출고": 1}
+# 입출고 대기 건수 (대기열 카운터)
+with profiler.section("입출고 대기 건수", cached=True):
+    pending_io = get_pending_queue().counts()
 
 # -----------------------------
 # KPI 지표 표시 (3열 구성)
@@ -97,22 +87,10 @@ st.divider()
 # -----------------------------
 # 수익 추이
 # -----------------------------
-df = inventory_logs.copy()
-df["날짜"] = pd.to_datetime(df["날짜"])
-df["월"] = df["날짜"].dt.to_period("M").astype(str)
-
-# 🔧 숫자형 변환 (빈칸 → 0)
-df["입고단가"] = pd.to_numeric(df["입고단가"], errors="coerce").fillna(0)
-df["출고단가"] = pd.to_numeric(df["출고단가"], errors="coerce").fillna(0)
-df["수량"] = pd.to_numeric(df["수량"], errors="coerce").fillna(0)
-
-# ✅ 수익 계산
-df["수익"] = df.apply(
-    lambda r: (r["출고단가"] - r["입고단가"]) * r["수량"] if r["구분"] == "출고" else 0,
-    axis=1
-)
-
-monthly_profit = df.groupby("월")["수익"].sum().reset_index()
+# ✅ 수익 계산 (원장 version이 바뀔 때만 재계산)
+with profiler.section("월별 수익", cached=True) as timing:
+    monthly_profit = ledger.monthly_profit().reset_index()
+    timing["rows"] = len(monthly_profit)
 
 # 📈 시각화
 fig_profit = px.bar(
@@ -133,3 +111,5 @@ st.plotly_chart(fig_profit, use_container_width=True)
 # 안내 및 TODO
 # -----------------------------
 st.info("📌 좌측 메뉴에서 다른 기능으로 이동하세요.")
+
+render_debug_panel(profiler)
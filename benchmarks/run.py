@@ -0,0 +1,194 @@
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from core.ledger import LedgerStore, prepare_ledger
+from core.profit import monthly_profit
+from core.journal import Journal
+from core.posting import InventoryPosting
+from core.statements import income_statement, cash_flow_statement
+from core.hr import EmployeeRepository, employee_label
+from core.documents import similarity
+from data.generator import generate_employees, generate_attendance, generate_inventory, generate_documents, write_employee_db
+
+# -----------------------------
+# 페이지별 계산 경로 벤치마크
+# -----------------------------
+RESULTS_DIR = Path(__file__).parent / "results"
+
+SCALES = {
+    "1k": {"movements": 1_000, "employees": 10, "documents": 100},
+    "100k": {"movements": 100_000, "employees": 200, "documents": 1_000},
+    "1m": {"movements": 1_000_000, "employees": 1_000, "documents": 5_000},
+}
+
+def build_dataset(scale, workdir, seed=0):
+    sizes = SCALES[scale]
+    employees = generate_employees(sizes["employees"], seed)
+    attendance = generate_attendance(employees, days=20, seed=seed)
+    db_path = Path(workdir) / f"employee_{scale}.db"
+    write_employee_db(employees, attendance, db_path)
+    return {
+        "ledger": generate_inventory(sizes["movements"], employees["name"].to_numpy(), seed=seed),
+        "employees": employees,
+        "employee_db": db_path,
+        "documents": pd.DataFrame(generate_documents(sizes["documents"], employees, seed=seed)),
+    }
+
+def cases(data):
+    """(이름, 준비 함수, 측정 함수) 목록. 준비 함수 결과가 측정 함수 인자로 전달된다"""
+    ledger = data["ledger"]
+    store = LedgerStore(ledger)
+    items = ledger["품목명"].cat.categories.tolist()
+    last_month = ledger["날짜"].max().strftime("%Y-%m")
+
+    # Home.py
+    yield "home.store_cold_start", lambda: ledger, lambda df: LedgerStore(df)
+    yield "home.prepare_ledger", lambda: ledger, prepare_ledger
+    yield "home.kpis", lambda: store, lambda s: s.kpi_summary(last_month)
+    yield "home.monthly_profit", lambda: store.prepared(), monthly_profit
+
+    # pages/inventory.py
+    yield "inventory.get_available_items", lambda: store, lambda s: s.available_items()
+    yield "inventory.get_latest_in_info", lambda: store, lambda s: [s.latest_receipt(item) for item in items]
+    yield "inventory.stock_as_of", lambda: store.asof_index(), \
+        lambda ix: [ix.stock_as_of(item, ledger["날짜"].median()) for item in items]
+    yield "inventory.valuation", lambda: store, lambda s: s.valuation()
+
+    # 화면에서 한 건씩 등록하고 매 rerun마다 원장 표/시점 재고를 다시 읽는 경우
+    def warm_store():
+        warm = LedgerStore(ledger.iloc[:-100])
+        warm.prepared()
+        warm.asof_index()
+        return warm
+    registrations = ledger.iloc[-100:].to_dict("records")
+    def register_with_reads(s):
+        for row in registrations:
+            s.append(row)
+            s.prepared()
+            s.asof_index()
+    yield "inventory.register_with_reads", warm_store, register_with_reads
+
+    # pages/accounting.py (입출고 건수만큼 2라인 전표)
+    n = len(ledger)
+    amounts = ledger["수량"].to_numpy(dtype="int64") * ledger["입고단가"].to_numpy(dtype="int64")
+    batch = (
+        ledger["날짜"].to_numpy(), np.repeat(np.arange(n), 2), np.tile(["재고자산", "매입채무"], n),
+        np.column_stack([amounts, np.zeros(n)]).ravel(), np.column_stack([np.zeros(n), amounts]).ravel(), [""] * n,
+    )
+    journal = Journal()
+    journal.post_many(*batch)
+    yield "accounting.post_many", Journal, lambda j: j.post_many(*batch)
+    yield "accounting.post_single", Journal, \
+        lambda j: [j.post(d, [("현금", 1000, 0), ("매출", 0, 1000)]) for d in ledger["날짜"].iloc[:10_000]]
+    yield "accounting.balance_sheet", lambda: journal, lambda j: (j.totals(), j.balance_sheet())
+    def closed_journal():
+        closed = Journal()
+        closed.post_many(*batch)
+        closed.close_period(closed.months()[-2])
+        return closed
+    as_of_dates = pd.date_range(ledger["날짜"].min(), ledger["날짜"].max(), periods=100)
+    yield "accounting.balance_sheet_as_of", closed_journal, \
+        lambda j: [j.balance_sheet(when) for when in as_of_dates]
+    period = (ledger["날짜"].min(), ledger["날짜"].max())
+    yield "accounting.income_statement", lambda: journal, lambda j: income_statement(j, *period, "M")
+    yield "accounting.cash_flow_statement", closed_journal, lambda j: cash_flow_statement(j, *period, "M")
+    yield "accounting.inventory_posting", lambda: InventoryPosting(store, Journal()), lambda p: p.post()
+
+    # pages/management.py
+    hr = EmployeeRepository(data["employee_db"])
+    last_id = int(data["employees"]["id"].iloc[-1])
+    yield "management.list_employees", lambda: hr, lambda r: r.employees()
+    yield "management.clock_out_update", lambda: hr, \
+        lambda r: r.clock_out(last_id, "2025-06-02", "2025-06-02T18:00:00")
+    yield "management.employee_options", lambda: hr, lambda r: employee_label(r.employees())
+
+    # pages/document.py (API 호출 제외)
+    docs = data["documents"]
+    embeddings = docs["임베딩"].tolist()
+    query = embeddings[0]
+    yield "document.similarity_search", lambda: embeddings, lambda embs: similarity(query, embs)
+
+def measure(prepare, func, repeat):
+    """(최소 실행 시간 초, 최대 메모리 바이트)"""
+    timings = []
+    for _ in range(repeat):
+        arg = prepare()
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+
+    arg = prepare()
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def latest_result(exclude=None):
+    files = sorted(p for p in RESULTS_DIR.glob("*.json") if p != exclude)
+    return json.loads(files[-1].read_text()) if files else None
+
+def compare(current, previous):
+    """이전 결과 대비 변화율 출력 (20% 이상 느려지면 표시)"""
+    before = {(r["scale"], r["case"]): r for r in previous["results"]}
+    print(f"\n이전 결과({previous['revision']}, {previous['created_at']}) 대비")
+    for r in current["results"]:
+        old = before.get((r["scale"], r["case"]))
+        if old is None:
+            continue
+        change = (r["seconds"] - old["seconds"]) / old["seconds"] * 100 if old["seconds"] else 0.0
+        flag = "  ⚠️ 느려짐" if change > 20 else ""
+        print(f"{r['scale']:>5} {r['case']:<36} {old['seconds']:>9.4f}s → {r['seconds']:>9.4f}s ({change:+.1f}%){flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="ERP 계산 경로 벤치마크")
+    parser.add_argument("--scales", default="1k,100k", help=f"쉼표로 구분 ({', '.join(SCALES)})")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 들어간 케이스만 실행")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales.split(","):
+            data = build_dataset(scale, workdir, args.seed)
+            for name, prepare, func in cases(data):
+                if args.filter not in name:
+                    continue
+                seconds, peak = measure(prepare, func, args.repeat)
+                results.append({"scale": scale, "case": name, "seconds": seconds, "peak_bytes": peak})
+                print(f"{scale:>5} {name:<36} {seconds:>9.4f}s  peak {peak / 2**20:>8.1f} MiB")
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "results": results,
+    }
+    RESULTS_DIR.mkdir(exist_ok=True)
+    path = RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}_{report['revision']}.json"
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {path}")
+
+    previous = latest_result(exclude=path)
+    if previous is not None:
+        compare(report, previous)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -----------------------------
+# 계정과목표
+# -----------------------------
+ACCOUNT_CLASSES = ["자산", "부채", "자본", "수익", "비용"]
+BALANCE_GROUPS = ["자산", "부채", "자본"]
+
+# 차변 잔액이 정상인 구분은 +1, 대변 잔액이 정상인 구분은 -1
+NORMAL_SIGN = {"자산": 1, "부채": -1, "자본": -1, "수익": -1, "비용": 1}
+
+CHART_OF_ACCOUNTS = [
+    # (계정명, 구분)
+    ("현금", "자산"), ("매출채권", "자산"), ("재고자산", "자산"),
+    ("선급금", "자산"), ("선급비용", "자산"), ("기타유동자산", "자산"),
+    ("건물", "자산"), ("토지", "자산"), ("기계장치", "자산"),
+    ("매입채무", "부채"), ("미지급금", "부채"), ("단기차입금", "부채"),
+    ("미지급비용", "부채"), ("선수금", "부채"), ("예수금", "부채"),
+    ("장기차입금", "부채"), ("사채", "부채"), ("충당부채", "부채"), ("기타비유동부채", "부채"),
+    ("자본금", "자본"), ("이익잉여금", "자본"), ("자본잉여금", "자본"),
+    ("기타포괄손익누계액", "자본"), ("자기주식", "자본"),
+    ("매출", "수익"), ("매출원가", "비용"), ("판매비와관리비", "비용"),
+]
+
+# 잔액 수동 수정·기초 잔액의 차액을 받는 계정
+ADJUSTMENT_ACCOUNT = "이익잉여금"
+
+# 기초 잔액 (구분별 정상 잔액 기준)
+OPENING_DATE = "2025-01-01"
+OPENING_MEMO = "기초 잔액"
+OPENING_BALANCES = {
+    "자산": {
+        '현금': 300000, '매출채권': 150000, '재고자산': 200000,
+        '선급금': 50000, '선급비용': 30000, '기타유동자산': 25000,
+        '건물': 500000, '토지': 600000, '기계장치': 400000
+    },
+    "부채": {
+        '매입채무': 100000, '미지급금': 50000, '단기차입금': 80000,
+        '미지급비용': 30000, '선수금': 20000, '예수금': 15000,
+        '장기차입금': 120000, '사채': 100000, '충당부채': 40000, '기타비유동부채': 30000
+    },
+    "자본": {
+        '자본금': 700000, '이익잉여금': 200000, '자본잉여금': 150000,
+        '기타포괄손익누계액': 50000, '자기주식': -10000
+    },
+}
+
+# 현금흐름표 활동 구분 - 나머지 계정(수익/비용 포함)은 영업활동
+CASH_ACCOUNT = "현금"
+INVESTING_ACCOUNTS = ["건물", "토지", "기계장치"]
+FINANCING_ACCOUNTS = [
+    "단기차입금", "장기차입금", "사채", "자본금", "이익잉여금",
+    "자본잉여금", "기타포괄손익누계액", "자기주식",
+]
+
+def account_class(chart=CHART_OF_ACCOUNTS):
+    return dict(chart)
+
+def adjustment_lines(changes, chart=CHART_OF_ACCOUNTS):
+    """{계정: 정상 잔액 증감} → 차대 차액을 ADJUSTMENT_ACCOUNT로 맞춘 (계정, 차변, 대변) 분개 라인
+
+    증감은 구분별 정상 잔액 기준(부채/자본이 늘면 +)이고, 음수 금액은 반대편으로 옮긴다.
+    """
+    classes = account_class(chart)
+    lines, net = [], 0
+    for account, change in changes.items():
+        if not change:
+            continue
+        signed = change * NORMAL_SIGN[classes[account]]   # 차변 +, 대변 -
+        lines.append((account, max(signed, 0), max(-signed, 0)))
+        net += signed
+    if net:
+        lines.append((ADJUSTMENT_ACCOUNT, max(-net, 0), max(net, 0)))
+    return lines
+
+def opening_lines(balances=OPENING_BALANCES, chart=CHART_OF_ACCOUNTS):
+    """기초 잔액 분개 라인"""
+    return adjustment_lines(
+        {account: value for group in BALANCE_GROUPS for account, value in balances[group].items()}, chart
+    )
@@ -0,0 +1,74 @@
+# -----------------------------
+# 사내 채팅 (직원 GPT 봇)
+# -----------------------------
+CHAT_MODEL = "gpt-4.1-mini"
+DEFAULT_PROMPT = "당신은 회사 직원입니다."
+
+def employee_directory(employees):
+    """전체 직원 명단 문자열 (모든 봇 프롬프트가 공유)"""
+    return "\n".join(
+        f"{name} ({position}, {department}, {email})"
+        for name, position, department, email
+        in employees[["name", "position", "department", "email"]].itertuples(index=False, name=None)
+    )
+
+def build_prompt(row, directory):
+    return f"""당신은 {row['department']} 부서의 {row['position']} {row['name']}입니다.
+ERP 시스템에서 사용자와 대화하며 업무를 지원합니다.
+다음은 전체 직원 명단입니다:
+{directory}
+답변은 직책에 맞는 말투로 하세요."""
+
+def bot_prompts(employees, current_user):
+    """현재 사용자를 뺀 직원별 system prompt {이름: 프롬프트}"""
+    directory = employee_directory(employees)
+    bots = employees[employees["name"] != current_user]
+    return {row["name"]: build_prompt(row, directory) for row in bots.to_dict("records")}
+
+def document_context(documents, bot_name):
+    """봇이 업로드한 문서의 요약/본문 (없으면 None)"""
+    matched = [doc for doc in documents if doc.get("업로더") == bot_name]
+    if not matched:
+        return None
+    return "\n\n".join(
+        f"[{doc['제목']} 요약]: {doc['요약']}\n[본문]: {doc.get('본문', '')[:1000]}"
+        for doc in matched
+    )
+
+def asks_about_documents(user_input):
+    return "문서" in user_input or "내용" in user_input
+
+def generate_reply(client, prompt, bot_name, user_input, documents=()):
+    """봇 답변. 문서를 묻는데 봇이 올린 문서가 없으면 API를 부르지 않고 바로 답한다"""
+    try:
+        context = document_context(documents, bot_name)
+        if context:
+            prompt += f"\n\n다음은 {bot_name}님이 업로드한 문서입니다. 필요 시 참고하세요:\n{context}"
+        elif asks_about_documents(user_input):
+            return "그건 제가 업로드 한 문서가 아니라 잘 모르겠습니다."
+
+        response = client.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": user_input}
+            ],
+            temperature=0.7,
+            max_tokens=500
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        return f"(오류: {e})"
+
+def last_message(history, name, current_user):
+    """목록 화면에 보일 최근 메시지"""
+    return next(
+        (chat["message"] for chat in reversed(history)
+         if chat["sender"] in (name, current_user) and
+         (chat.get("receiver") == name or chat.get("receiver") == current_user)),
+        "메시지 없음"
+    )
+
+def conversation(history, a, b):
+    """두 사람 사이의 메시지만"""
+    return [chat for chat in history if {chat.get("sender"), chat.get("receiver")} == {a, b}]
@@ -0,0 +1,102 @@
+from collections import deque
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# 원가 계산 (선입선출 / 이동평균)
+# -----------------------------
+COST_METHODS = {"fifo": "선입선출", "moving_average": "이동평균"}
+
+class CostLayers:
+    """품목별 원가층을 유지하며 출고 시 매출원가를 계산
+
+    입출고를 날짜순으로 한 번씩만 처리하고 상태를 유지하므로, 새 입출고는 이어서 반영할 수 있다.
+    재고보다 많이 출고되면 부족분은 마지막 입고단가로 계산한다.
+    """
+
+    def __init__(self, method="fifo"):
+        if method not in COST_METHODS:
+            raise ValueError(f"지원하지 않는 원가 계산 방법: {method}")
+        self.method = method
+        self.last_time = None
+        self._layers = {}      # fifo: 품목 → deque([수량, 단가])
+        self._average = {}     # moving_average: 품목 → [수량, 평균단가]
+        self._last_price = {}  # 품목 → 마지막 입고단가
+
+    def receive(self, item, quantity, price):
+        self._last_price[item] = price
+        if self.method == "fifo":
+            self._layers.setdefault(item, deque()).append([quantity, price])
+        else:
+            qty, avg = self._average.get(item, (0, 0.0))
+            total = qty + quantity
+            self._average[item] = [total, (qty * avg + quantity * price) / total if qty > 0 else price]
+
+    def issue(self, item, quantity):
+        """출고 수량의 매출원가 반환"""
+        if self.method == "moving_average":
+            qty, avg = self._average.get(item, (0, self._last_price.get(item, 0)))
+            self._average[item] = [qty - quantity, avg]
+            return quantity * avg
+
+        layers = self._layers.get(item)
+        cost, remaining = 0.0, quantity
+        while remaining > 0 and layers:
+            layer = layers[0]
+            used = min(layer[0], remaining)
+            cost += used * layer[1]
+            remaining -= used
+            layer[0] -= used
+            if layer[0] == 0:
+                layers.popleft()
+        return cost + remaining * self._last_price.get(item, 0)
+
+    def apply(self, item, kind, quantity, price, when):
+        """입출고 한 건 반영 후 매출원가 반환 (입고는 0)"""
+        when = pd.Timestamp(when)
+        self.last_time = when if self.last_time is None else max(self.last_time, when)
+        if kind == "출고":
+            return self.issue(item, int(quantity))
+        self.receive(item, int(quantity), float(price or 0))
+        return 0.0
+
+    def is_in_order(self, when):
+        """when이 이미 반영한 마지막 입출고보다 이르지 않은지 (아니면 처음부터 재계산 필요)"""
+        return self.last_time is None or pd.Timestamp(when) >= self.last_time
+
+    def process(self, df):
+        """입출고 행을 날짜순으로 반영하고 행별 매출원가 배열 반환 (입고 행은 0, df 순서 유지)"""
+        cogs = np.zeros(len(df))
+        if df.empty:
+            return cogs
+
+        dates = pd.to_datetime(df["날짜"]).to_numpy()
+        order = np.argsort(dates, kind="stable")
+        items = df["품목명"].to_numpy(dtype=object)[order].tolist()
+        is_out = (df["구분"] == "출고").to_numpy()[order].tolist()
+        qty = df["수량"].to_numpy(dtype="int64")[order].tolist()
+        price = pd.to_numeric(df["입고단가"], errors="coerce").fillna(0).to_numpy(dtype="float64")[order].tolist()
+
+        receive, issue = self.receive, self.issue
+        result = [0.0] * len(order)
+        for i, (item, out, q, p) in enumerate(zip(items, is_out, qty, price)):
+            if out:
+                result[i] = issue(item, q)
+            else:
+                receive(item, q, p)
+
+        cogs[order] = result
+        self.last_time = pd.Timestamp(dates[order[-1]]) if self.last_time is None \
+            else max(self.last_time, pd.Timestamp(dates[order[-1]]))
+        return cogs
+
+    def valuation(self):
+        """품목별 (재고 수량, 재고 평가액) DataFrame"""
+        rows = []
+        if self.method == "fifo":
+            for item, layers in self._layers.items():
+                rows.append((item, sum(q for q, _ in layers), sum(q * p for q, p in layers)))
+        else:
+            for item, (qty, avg) in self._average.items():
+                rows.append((item, qty, qty * avg))
+        return pd.DataFrame(rows, columns=["품목명", "재고수량", "재고평가액"])
@@ -0,0 +1,84 @@
+from itertools import combinations
+import numpy as np
+import pandas as pd
+from core.profit import compute_profit
+
+# -----------------------------
+# 입출고 집계 큐브 (월 × 품목 × 납품업체 × 담당자 × 구분)
+# -----------------------------
+CUBE_DIMENSIONS = ["월", "품목명", "납품업체명", "담당자명", "구분"]
+CUBE_MEASURES = ["건수", "수량", "입고금액", "매출", "매출원가", "수익"]
+
+def _measures(df):
+    is_out = (df["구분"] == "출고").to_numpy()
+    qty = df["수량"].to_numpy(dtype="float64")
+    cogs = df["매출원가"].to_numpy(dtype="float64") if "매출원가" in df.columns else np.zeros(len(df))
+    return pd.DataFrame({
+        "건수": np.ones(len(df), dtype="int64"),
+        "수량": qty,
+        "입고금액": np.where(is_out, 0, df["입고단가"].to_numpy(dtype="float64") * qty),
+        "매출": np.where(is_out, df["출고단가"].to_numpy(dtype="float64") * qty, 0),
+        "매출원가": np.where(is_out, cogs, 0),
+        "수익": compute_profit(df).to_numpy(),
+    })
+
+def _grand_total(df):
+    # 한 행짜리 총합계. 행을 열로 뒤집으면 측정값이 float로 바뀌므로 원래 dtype으로 되돌린다
+    measures = df[CUBE_MEASURES]
+    return measures.sum().to_frame().T.astype(measures.dtypes)
+
+class LedgerCube:
+    """원장 차원 조합별 합계를 미리 계산해 둔 큐브
+
+    가장 세밀한 조합(모든 차원)을 원장에서 한 번 집계하고, 나머지 조합은 그 결과를 다시 합쳐서 만든다.
+    """
+
+    def __init__(self, cuboids):
+        self._cuboids = cuboids   # 정렬된 차원 튜플 → 합계 DataFrame
+
+    @classmethod
+    def build(cls, df):
+        keys = {dim: df[dim].astype(object).fillna("(없음)").to_numpy() for dim in CUBE_DIMENSIONS}
+        base = _measures(df).groupby([keys[dim] for dim in CUBE_DIMENSIONS]).sum()
+        base.index.names = CUBE_DIMENSIONS
+        base = base.reset_index()
+
+        cuboids = {}
+        for size in range(len(CUBE_DIMENSIONS) + 1):
+            for dims in combinations(CUBE_DIMENSIONS, size):
+                if size == 0:
+                    cuboids[dims] = _grand_total(base)
+                else:
+                    cuboids[dims] = base.groupby(list(dims), sort=True)[CUBE_MEASURES].sum().reset_index()
+        return cls(cuboids)
+
+    def members(self, dim):
+        """차원에 속한 값 목록"""
+        return self._cuboids[(dim,)][dim].tolist()
+
+    def rollup(self, dims, filters=None):
+        """dims 기준 합계. filters({차원: 값 목록})가 있으면 필터 차원까지 포함한 조합에서 거른 뒤 합친다"""
+        filters = {dim: values for dim, values in (filters or {}).items() if values}
+        needed = tuple(dim for dim in CUBE_DIMENSIONS if dim in dims or dim in filters)
+        df = self._cuboids[needed]
+        for dim, values in filters.items():
+            df = df[df[dim].isin(values)]
+        if list(needed) == [dim for dim in CUBE_DIMENSIONS if dim in dims]:
+            return df[list(dims) + CUBE_MEASURES].reset_index(drop=True)
+        if not dims:
+            return _grand_total(df)
+        return df.groupby(list(dims), sort=True)[CUBE_MEASURES].sum().reset_index()
+
+    def drill_down(self, dims, next_dim, filters=None):
+        """현재 차원에 한 단계 더 세분화"""
+        return self.rollup(list(dims) + [next_dim], filters)
+
+    def pivot(self, rows, column, measure, filters=None):
+        """행 차원 × 열 차원 피벗 표"""
+        dims = list(rows) + ([column] if column else [])
+        df = self.rollup(dims, filters)
+        if not column:
+            return df.set_index(list(rows))[[measure]] if rows else df[[measure]]
+        if not rows:
+            return df.set_index(column)[[measure]].T
+        return df.pivot_table(index=list(rows), columns=column, values=measure, aggfunc="sum", fill_value=0)
@@ -0,0 +1,26 @@
+import os
+import streamlit as st
+from core.profiling import Profiler, LOG_PATH
+
+# -----------------------------
+# 구간별 실행 시간 디버그 패널 (Streamlit 연결)
+# -----------------------------
+DEBUG_PARAM = "debug"
+DEBUG_LOG_PATH = "timings.jsonl"
+
+def page_profiler(page):
+    """페이지 상단에서 호출. rerun마다 새 Profiler (파일 기록은 ERP_TIMING_LOG 지정 또는 디버그 모드일 때만)"""
+    return Profiler(page, log_path=LOG_PATH or (DEBUG_LOG_PATH if debug_enabled() else ""))
+
+def debug_enabled():
+    return st.query_params.get(DEBUG_PARAM) == "1" or os.environ.get("ERP_DEBUG") == "1"
+
+def render_debug_panel(profiler):
+    """페이지 하단에서 호출. ?debug=1 또는 ERP_DEBUG=1일 때 사이드바에 구간별 시간 표시"""
+    if not debug_enabled():
+        return
+    with st.sidebar.expander("⏱️ 구간별 실행 시간", expanded=True):
+        df = profiler.frame()
+        df["ms"] = (df["seconds"] * 1000).round(1)
+        st.dataframe(df[["section", "ms", "rows", "cache"]], hide_index=True)
+        st.caption(f"rerun {profiler.run_id} · 전체 {profiler.elapsed() * 1000:.0f} ms")
@@ -0,0 +1,114 @@
+import re
+import threading
+import fitz
+import numpy as np
+import pandas as pd
+from core.profiling import mark_miss
+
+# -----------------------------
+# 문서 저장/검색
+# -----------------------------
+DOCUMENT_COLUMNS = ["제목", "파일명", "업로더", "등록일", "파일데이터", "요약", "임베딩", "본문"]
+EMBEDDING_MODEL = "text-embedding-3-small"
+SUMMARY_MODEL = "gpt-4-1106-preview"
+
+def empty_documents():
+    return pd.DataFrame(columns=DOCUMENT_COLUMNS)
+
+def versioned_filename(filename, existing):
+    """같은 파일명이 있으면 name_vN.ext 형식으로 다음 버전 이름 반환"""
+    name, ext = re.match(r"(.+?)(\.[^.]+)?$", filename).groups()
+    ext = ext or ""
+    pattern = re.compile(f"{re.escape(name)}(?:_v(\\d+)){re.escape(ext)}")
+    versions = [int(m.group(1)) for f in existing if (m := pattern.match(f))]
+    if filename in existing:
+        versions.append(0)
+    new_version = max(versions) + 1 if versions else None
+    return filename if new_version is None else f"{name}_v{new_version}{ext}"
+
+def extract_text_from_pdf(file_bytes):
+    try:
+        pdf = fitz.open(stream=file_bytes, filetype="pdf")
+        return "\n".join(page.get_text() for page in pdf)
+    except Exception:
+        return ""
+
+def summarize_and_embed(client, title, text):
+    """GPT 요약 + 본문 임베딩. 실패하면 (오류 메시지, [])"""
+    try:
+        summary_resp = client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": "당신은 ERP 기업 문서 요약 도우미입니다. 문서 내용을 간결하게 요약하세요."},
+                {"role": "user", "content": text[:6000]}
+            ],
+            temperature=0.3
+        )
+        summary = summary_resp.choices[0].message.content.strip()
+        emb_resp = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=f"{title}\n\n{text[:8000]}"
+        )
+        return summary, emb_resp.data[0].embedding
+    except Exception as e:
+        return f"요약 실패: {e}", []
+
+def embed_texts(client, texts):
+    """여러 문장을 임베딩 요청 한 번으로"""
+    if not texts:
+        return []
+    resp = client.embeddings.create(model=EMBEDDING_MODEL, input=list(texts))
+    return [item.embedding for item in sorted(resp.data, key=lambda item: item.index)]
+
+class EmbeddingCache:
+    """문장 → 임베딩. 없는 문장만 모아서 한 번에 요청"""
+
+    def __init__(self):
+        self._vectors = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, client, texts):
+        with self._lock:
+            missing = list(dict.fromkeys(t for t in texts if t not in self._vectors))
+        if missing:
+            mark_miss()
+            vectors = embed_texts(client, missing)
+            with self._lock:
+                self._vectors.update(zip(missing, vectors))
+        with self._lock:
+            return [self._vectors[t] for t in texts]
+
+def similarity(query_emb, embeddings):
+    """질의 임베딩과 각 임베딩의 코사인 유사도 배열 (빈 임베딩은 0)
+
+    행마다 cosine_similarity를 부르지 않고 같은 차원의 임베딩을 행렬로 쌓아 한 번에 계산한다.
+    """
+    query = np.asarray(query_emb, dtype="float64")
+    scores = np.zeros(len(embeddings))
+    rows = [i for i, emb in enumerate(embeddings) if emb is not None and len(emb) == len(query)]
+    if not rows or not query.any():
+        return scores
+    matrix = np.array([embeddings[i] for i in rows], dtype="float64")
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    scores[rows] = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    return scores
+
+def keyword_filter(df, search):
+    """제목 또는 업로더에 검색어가 들어간 문서"""
+    q = search.lower()
+    mask = df["제목"].str.lower().str.contains(q, regex=False) | df["업로더"].str.lower().str.contains(q, regex=False)
+    return df[mask]
+
+def rank_documents(df, title_sims, content_sims, w_title):
+    """제목/본문 유사도 가중합으로 정렬"""
+    df = df.copy()
+    df["제목 유사도"] = title_sims
+    df["본문 유사도"] = content_sims
+    df["종합 유사도"] = w_title * df["제목 유사도"] + (1 - w_title) * df["본문 유사도"]
+    return df.sort_values(by="종합 유사도", ascending=False)
+
+def sort_documents(df, ext_filter, sort_by, ascending):
+    if ext_filter != "전체":
+        df = df[df["파일명"].str.lower().str.endswith(ext_filter)]
+    return df.sort_values(by=sort_by, ascending=ascending).reset_index(drop=True)
@@ -0,0 +1,116 @@
+import sqlite3
+import threading
+import pandas as pd
+
+# -----------------------------
+# 인사 관리 (직원 / 출퇴근 기록)
+# -----------------------------
+EMPLOYEE_DB_PATH = "employee.db"
+POSITIONS = ["사원", "대리", "과장", "차장", "부장", "임원"]
+DEPARTMENTS = ["경영팀", "물류팀", "인사팀", "영업팀", "전산팀", "마케팅팀"]
+LOCATIONS = ["본사", "재택"]
+
+def employee_label(df):
+    """선택 상자용 "이름 (id)" 목록"""
+    return (df["name"].astype(str) + " (" + df["id"].astype(str) + ")").tolist()
+
+def parse_employee_label(label):
+    """"이름 (id)" → id"""
+    return int(label.split("(")[-1][:-1])
+
+class EmployeeRepository:
+    """employees / attendance_logs 테이블 저장소. 모든 세션이 연결 하나를 공유"""
+
+    def __init__(self, path=EMPLOYEE_DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS employees (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                position TEXT,
+                department TEXT,
+                join_date TEXT,
+                email TEXT
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS attendance_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER,
+                date TEXT,
+                clock_in TEXT,
+                clock_out TEXT,
+                location TEXT
+            )
+        """)
+        # 퇴근 기록은 (직원, 날짜)로 찾음
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_attendance_employee_date ON attendance_logs (employee_id, date)"
+        )
+        self.conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def seed(self, employees, attendance):
+        """직원/출퇴근 DataFrame을 한 트랜잭션으로 저장"""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO employees (id, name, position, department, join_date, email) VALUES (?, ?, ?, ?, ?, ?)",
+                employees[["id", "name", "position", "department", "join_date", "email"]]
+                .astype(object).itertuples(index=False, name=None)
+            )
+            self.conn.executemany(
+                "INSERT INTO attendance_logs (employee_id, date, clock_in, clock_out, location) VALUES (?, ?, ?, ?, ?)",
+                attendance[["employee_id", "date", "clock_in", "clock_out", "location"]]
+                .astype(object).itertuples(index=False, name=None)
+            )
+
+    def employees(self):
+        with self._lock:
+            return pd.read_sql_query("SELECT * FROM employees", self.conn)
+
+    def add_employee(self, name, position, department, join_date, email):
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO employees (name, position, department, join_date, email) VALUES (?, ?, ?, ?, ?)",
+                (name, position, department, join_date, email)
+            )
+            return cursor.lastrowid
+
+    def update_employee(self, employee_id, name, position, department, join_date, email):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE employees SET name=?, position=?, department=?, join_date=?, email=? WHERE id=?",
+                (name, position, department, join_date, email, employee_id)
+            )
+
+    def delete_employee(self, employee_id):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM employees WHERE id=?", (employee_id,))
+
+    def clock_in(self, employee_id, date, when, location):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO attendance_logs (employee_id, date, clock_in, location) VALUES (?, ?, ?, ?)",
+                (employee_id, date, when, location)
+            )
+
+    def clock_out(self, employee_id, date, when):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE attendance_logs SET clock_out=? WHERE employee_id=? AND date=?",
+                (when, employee_id, date)
+            )
+
+    def attendance(self, date=None):
+        """출퇴근 기록 (date가 있으면 그 날짜만)"""
+        query = "SELECT * FROM attendance_logs"
+        params = ()
+        if date is not None:
+            query += " WHERE date = ?"
+            params = (date,)
+        with self._lock:
+            return pd.read_sql_query(query, self.conn, params=params)
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+from core.schema import LEDGER_COLUMNS, MOVEMENT_TYPES, apply_schema
+from core.profit import compute_margin_rate
+
+# -----------------------------
+# 입출고 일괄 등록 (CSV/XLSX)
+# -----------------------------
+REQUIRED_COLUMNS = ["날짜", "품목명", "구분", "수량"]
+PRICE_COLUMNS = ["입고단가", "예상출고단가", "출고단가"]
+CHUNK_SIZE = 50_000
+
+def read_movements(file, filename, chunksize=CHUNK_SIZE):
+    """업로드 파일을 chunk 단위 DataFrame으로 읽음 (행번호 컬럼 포함)"""
+    if filename.lower().endswith((".xlsx", ".xls")):
+        sheet = pd.read_excel(file, dtype=str)
+        chunks = (sheet.iloc[i:i + chunksize] for i in range(0, len(sheet), chunksize))
+    else:
+        chunks = pd.read_csv(file, dtype=str, chunksize=chunksize, skipinitialspace=True)
+
+    for chunk in chunks:
+        # 헤더 1행을 포함한 원본 파일 기준 행번호
+        yield chunk.assign(행번호=chunk.index + 2)
+
+def check_columns(df):
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼 누락: {', '.join(missing)}")
+
+def _reject(mask, reason, reasons):
+    # 아직 사유가 없는 행에만 첫 번째 사유 기록
+    hit = mask & reasons.isna().to_numpy()
+    reasons[hit] = reason
+
+def validate_types(chunk):
+    """컬럼/타입/값 검증 → (정상 행, 거부 행). 모든 검사는 컬럼 단위로 한 번에 수행"""
+    check_columns(chunk)
+    df = chunk.reindex(columns=LEDGER_COLUMNS + ["행번호"])
+    reasons = pd.Series(pd.NA, index=df.index, dtype="object")
+
+    df["품목명"] = df["품목명"].str.strip()
+    _reject(df["품목명"].fillna("").eq("").to_numpy(), "품목명 없음", reasons)
+
+    df["구분"] = df["구분"].str.strip()
+    _reject(~df["구분"].isin(MOVEMENT_TYPES).to_numpy(), "구분은 입고/출고만 가능", reasons)
+
+    dates = pd.to_datetime(df["날짜"], errors="coerce")
+    _reject(dates.isna().to_numpy(), "날짜 형식 오류", reasons)
+    df["날짜"] = dates
+
+    qty = pd.to_numeric(df["수량"], errors="coerce")
+    bad_qty = qty.isna() | (qty <= 0) | (qty % 1 != 0)
+    _reject(bad_qty.to_numpy(), "수량은 1 이상의 정수", reasons)
+    df["수량"] = qty
+
+    for col in PRICE_COLUMNS:
+        blank = df[col].isna() | df[col].astype(str).str.strip().eq("")
+        price = pd.to_numeric(df[col], errors="coerce")
+        _reject(((~blank & price.isna()) | (price < 0)).to_numpy(), f"{col} 형식 오류", reasons)
+        df[col] = price
+
+    rejected = chunk.loc[reasons.notna()].assign(사유=reasons[reasons.notna()])
+    return df.loc[reasons.isna()], rejected
+
+def check_stock(df, stock_before, existing=None):
+    """날짜순 누적 재고가 음수가 되는 출고 행을 거부 → (정상 행, 거부 행)
+
+    stock_before는 업로드의 가장 이른 날짜 직전 품목별 재고, existing은 그 날짜 이후의 기존 원장 행이다.
+    기존 행은 업로드 행과 함께 날짜순으로 누적하지만 거부하지 않는다 (같은 일시면 기존 행이 먼저).
+    업로드 출고 때문에 어느 시점의 재고가 음수가 되면(기존 행 지점 포함) 품목마다 그 지점까지의
+    마지막 업로드 출고 한 건씩 제외하고 다시 누적해, 거부된 출고가 뒤따르는 행에 영향을 주지 않게 한다.
+    """
+    df = df.sort_values("날짜", kind="stable")
+    if existing is None:
+        existing = df.iloc[:0]
+    existing = existing[existing["품목명"].isin(df["품목명"].unique())]
+
+    n = len(df)
+    dates = np.concatenate([df["날짜"].to_numpy(dtype="datetime64[ns]"), existing["날짜"].to_numpy(dtype="datetime64[ns]")])
+    items = np.concatenate([df["품목명"].to_numpy(dtype=object), existing["품목명"].to_numpy(dtype=object)])
+    is_out = np.concatenate([(df["구분"] == "출고").to_numpy(), (existing["구분"] == "출고").to_numpy()])
+    quantity = np.concatenate([df["수량"].to_numpy(dtype="int64"), existing["수량"].to_numpy(dtype="int64")])
+    uploaded = np.arange(len(dates)) < n
+
+    # 품목별로 모으되 품목 안에서는 날짜순 (같은 일시는 기존 행 먼저)
+    codes, uniques = pd.factorize(items)
+    order = np.lexsort((uploaded, dates, codes))
+    group = codes[order]
+    group_start = np.zeros(len(order), dtype="int64")
+    boundaries = np.flatnonzero(np.diff(group)) + 1
+    group_start[boundaries] = boundaries
+    group_start = np.maximum.accumulate(group_start)
+    start = np.array([stock_before.get(item, 0) for item in uniques], dtype="int64")[group]
+    is_out, uploaded = is_out[order], uploaded[order]
+    signed = np.where(is_out, -1, 1) * quantity[order]
+    positions = np.arange(len(order))
+
+    def running(mask):
+        cumulative = np.cumsum(np.where(mask, signed, 0))
+        before_group = np.where(group_start > 0, cumulative[group_start - 1], 0)
+        return cumulative - before_group + start
+
+    # 기존 원장만 누적했을 때 이미 음수인 지점은 업로드 탓이 아니므로 그 값까지는 허용
+    floor = np.minimum(running(~uploaded), 0)
+    keep = np.ones(len(order), dtype=bool)
+    while True:
+        violation = np.flatnonzero(running(keep) < floor)
+        if len(violation) == 0:
+            break
+        # 품목별 첫 위반 지점까지의 마지막 업로드 출고 한 건만 제외
+        violation = violation[np.r_[True, group[violation][1:] != group[violation][:-1]]]
+        candidates = np.where(keep & uploaded & is_out, positions, -1)
+        last = np.maximum.accumulate(candidates)[violation]
+        keep[last] = False
+
+    keep_uploaded = np.empty(n, dtype=bool)
+    keep_uploaded[order[uploaded]] = keep[uploaded]
+    rejected = df.loc[~keep_uploaded].assign(사유="재고 부족")
+    return df.loc[keep_uploaded], rejected
+
+def fill_derived(df, receipts):
+    """출고 행의 빈 입고단가를 그 일시(포함) 직전 입고단가로 채우고 마진율 계산
+
+    입고 후보는 기존 원장 입고(receipts: 날짜, 품목명, 입고단가)와 같은 파일의 입고 행이다.
+    df는 날짜순으로 정렬되어 있어야 한다.
+    """
+    df = df.copy()
+    is_out = (df["구분"] == "출고").to_numpy()
+    missing_in = is_out & df["입고단가"].fillna(0).eq(0).to_numpy()
+    if missing_in.any():
+        in_file = df.loc[~is_out & df["입고단가"].notna().to_numpy(), ["날짜", "품목명", "입고단가"]]
+        candidates = pd.concat([receipts[["날짜", "품목명", "입고단가"]], in_file], ignore_index=True)
+        candidates = candidates.astype({"날짜": "datetime64[ns]", "품목명": object}).sort_values("날짜", kind="stable")
+        targets = df.loc[missing_in, ["날짜", "품목명"]].astype({"날짜": "datetime64[ns]", "품목명": object})
+        matched = pd.merge_asof(
+            targets.reset_index(), candidates, on="날짜", by="품목명", direction="backward"
+        ).set_index("index")
+        df.loc[matched.index, "입고단가"] = matched["입고단가"].to_numpy()
+
+    for col in ["입고단가", "출고단가"]:
+        df[col] = df[col].fillna(0)
+    df["마진율"] = compute_margin_rate(df)
+    return df
+
+def import_movements(file, filename, stock_as_of, movements_after, receipts):
+    """파일 전체 검증 → (등록할 원장 행, 거부 행 보고서)
+
+    재고 검사는 업로드의 가장 이른 날짜 직전 재고(stock_as_of(품목, 시점))에서 시작해
+    그 날짜 이후의 기존 입출고(movements_after(시점))와 함께 누적한다.
+    빈 입고단가는 기존 원장 입고 이력(receipts)과 파일의 입고 중 그 행 날짜 직전 입고로 채운다.
+    거부 행 보고서는 사유와 관계없이 업로드 파일의 원본 값을 보여준다.
+    """
+    accepted, rejected, originals = [], [], []
+    for chunk in read_movements(file, filename):
+        ok, bad = validate_types(chunk)
+        accepted.append(ok)
+        rejected.append(bad)
+        originals.append(chunk.loc[ok.index])
+
+    accepted = pd.concat(accepted, ignore_index=True) if accepted else pd.DataFrame(columns=LEDGER_COLUMNS)
+    if accepted.empty:
+        stock_before, existing = {}, None
+    else:
+        first = accepted["날짜"].min()
+        just_before = first - pd.Timedelta(1, "ns")
+        stock_before = {item: stock_as_of(item, just_before) for item in accepted["품목명"].unique()}
+        existing = movements_after(first)
+    accepted, short = check_stock(accepted, stock_before, existing)
+    if not short.empty:
+        originals = pd.concat(originals, ignore_index=True).set_index("행번호", drop=False)
+        rejected.append(originals.loc[short["행번호"]].reset_index(drop=True).assign(사유="재고 부족"))
+
+    accepted = fill_derived(accepted, receipts)
+    report = pd.concat(rejected, ignore_index=True).sort_values("행번호")
+    return apply_schema(accepted[LEDGER_COLUMNS]), report[["행번호"] + [c for c in report.columns if c != "행번호"]]
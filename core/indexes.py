@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# 원장 보조 인덱스 (등록 시 증분 갱신, 콜드 스타트 때만 전체 재구성)
+# -----------------------------
+
+def _signed_quantity(df):
+    qty = df["수량"].to_numpy(dtype="int64")
+    return np.where((df["구분"] == "출고").to_numpy(), -qty, qty)
+
+class StockIndex:
+    """품목별 현재 재고 수량 (입고 +, 출고 -)"""
+
+    def __init__(self):
+        self._on_hand = {}
+
+    @classmethod
+    def build(cls, df):
+        index = cls()
+        index.apply(df)
+        return index
+
+    def apply(self, df):
+        """여러 입출고 행을 한 번에 반영"""
+        if df.empty:
+            return
+        totals = pd.Series(_signed_quantity(df)).groupby(df["품목명"].to_numpy()).sum()
+        for item, delta in totals.items():
+            self._on_hand[item] = self._on_hand.get(item, 0) + int(delta)
+
+    def apply_movement(self, item, kind, quantity):
+        """입출고 한 건 반영"""
+        delta = -int(quantity) if kind == "출고" else int(quantity)
+        self._on_hand[item] = self._on_hand.get(item, 0) + delta
+
+    def on_hand(self, item):
+        return self._on_hand.get(item, 0)
+
+    def available(self):
+        """재고가 남아 있는 품목 → 수량"""
+        return {item: qty for item, qty in self._on_hand.items() if qty > 0}
+
+class LatestReceiptIndex:
+    """품목별 가장 최근 입고의 (입고단가, 납품업체명, 일시)"""
+
+    def __init__(self):
+        self._latest = {}
+
+    @classmethod
+    def build(cls, df):
+        index = cls()
+        index.apply(df)
+        return index
+
+    def apply(self, df):
+        """여러 입출고 행을 한 번에 반영 (입고 행만 사용)"""
+        receipts = df[df["구분"] == "입고"]
+        if receipts.empty:
+            return
+        dates = pd.to_datetime(receipts["날짜"])
+        latest = (
+            receipts.assign(날짜=dates)
+            .sort_values("날짜", kind="stable")
+            .drop_duplicates("품목명", keep="last")
+        )
+        for item, price, supplier, date in zip(
+            latest["품목명"], latest["입고단가"], latest["납품업체명"], latest["날짜"]
+        ):
+            self.apply_receipt(item, price, supplier, date)
+
+    def apply_receipt(self, item, price, supplier, date):
+        """입고 한 건 반영 (기존보다 이르지 않은 입고만 교체)"""
+        date = pd.Timestamp(date)
+        current = self._latest.get(item)
+        if current is None or date >= current[2]:
+            self._latest[item] = (int(price), supplier, date)
+
+    def lookup(self, item):
+        """(입고단가, 납품업체명, 일시) 또는 None"""
+        return self._latest.get(item)
+
+class AsOfStockIndex:
+    """품목별 (일시 배열, 누적 재고 배열). 특정 시점 재고는 이진 탐색 한 번으로 조회"""
+
+    def __init__(self, series):
+        self._series = series   # 품목 → (datetime64[ns] 배열, int64 누적 수량 배열)
+
+    @classmethod
+    def build(cls, df):
+        df = df.sort_values("날짜", kind="stable")
+        codes, items = pd.factorize(df["품목명"].to_numpy())
+        order = np.argsort(codes, kind="stable")
+        times = df["날짜"].to_numpy(dtype="datetime64[ns]")[order]
+        signed = _signed_quantity(df)[order]
+
+        bounds = np.r_[0, np.flatnonzero(np.diff(codes[order])) + 1, len(order)]
+        series = {}
+        for i, item in enumerate(items):
+            lo, hi = bounds[i], bounds[i + 1]
+            series[item] = (times[lo:hi], np.cumsum(signed[lo:hi]))
+        return cls(series)
+
+    def extend(self, df):
+        """기존 마지막 일시 이후의 입출고 행을 이어 붙임"""
+        if df.empty:
+            return
+        df = df.sort_values("날짜", kind="stable")
+        signed = pd.Series(_signed_quantity(df))
+        times = df["날짜"].to_numpy(dtype="datetime64[ns]")
+        for item, rows in signed.groupby(df["품목명"].to_numpy()).groups.items():
+            rows = np.asarray(rows)
+            old_times, old_cumulative = self._series.get(item, (times[:0], np.zeros(0, dtype="int64")))
+            base = old_cumulative[-1] if len(old_cumulative) else 0
+            self._series[item] = (
+                np.concatenate([old_times, times[rows]]),
+                np.concatenate([old_cumulative, base + np.cumsum(signed.to_numpy()[rows])]),
+            )
+
+    def items(self):
+        return list(self._series)
+
+    def stock_as_of(self, item, when):
+        """when 시점(포함)까지의 입출고를 반영한 재고 수량"""
+        if item not in self._series:
+            return 0
+        times, cumulative = self._series[item]
+        pos = np.searchsorted(times, np.datetime64(pd.Timestamp(when), "ns"), side="right")
+        return int(cumulative[pos - 1]) if pos > 0 else 0
+
+    def all_as_of(self, when):
+        """when 시점 전체 품목 재고 → 품목: 수량"""
+        return {item: self.stock_as_of(item, when) for item in self._series}
@@ -0,0 +1,334 @@
+import threading
+from bisect import bisect_left
+from contextlib import nullcontext
+import numpy as np
+import pandas as pd
+from core.accounting import ACCOUNT_CLASSES, BALANCE_GROUPS, NORMAL_SIGN, CHART_OF_ACCOUNTS
+
+# -----------------------------
+# 복식부기 분개장 (배열 컬럼 + 계정별 누계 잔액)
+# -----------------------------
+NET_INCOME = "당기순이익"
+
+class _Column:
+    """용량을 두 배씩 늘리는 numpy 배열 (뒤에 추가만 함)"""
+
+    def __init__(self, dtype, capacity=1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        end = self._size + len(values)
+        if end > len(self._data):
+            grown = np.empty(max(end, len(self._data) * 2), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:end] = values
+        self._size = end
+
+    def view(self):
+        return self._data[:self._size]
+
+class Journal:
+    """전표(차변/대변 라인) 저장소. 라인은 컬럼별 배열에 쌓이고 계정 잔액은 전기할 때마다 누계에 더한다
+
+    잔액 조회는 라인을 다시 합치지 않고 계정 수만큼의 누계 배열만 읽는다.
+    repository(JournalRepository)가 있으면 전기/마감을 먼저 저장소에 쓰고 메모리에 반영한다.
+    """
+
+    def __init__(self, chart=CHART_OF_ACCOUNTS, repository=None):
+        self.accounts = pd.Index([name for name, _ in chart])
+        self.classes = [cls for _, cls in chart]
+        self._class_codes = np.array([ACCOUNT_CLASSES.index(cls) for cls in self.classes])
+        self._signs = np.array([NORMAL_SIGN[cls] for cls in self.classes], dtype="int64")
+        self._codes = {name: i for i, name in enumerate(self.accounts)}
+
+        self._entry = _Column("int64")
+        self._date = _Column("datetime64[ns]")
+        self._account = _Column("int32")
+        self._debit = _Column("int64")
+        self._credit = _Column("int64")
+        self._memos = []                                     # 전표번호 → 적요
+        self._balances = np.zeros(len(self.accounts), dtype="int64")   # 계정별 차변 - 대변 누계
+        self._monthly = {}           # 월 → 그 달 계정별 차변 - 대변 합계
+        self._month_lines = {}       # 월 → 그 달 라인 위치 배열 목록
+        self._snapshots = {}         # 마감 월 → 월말 계정별 차변 - 대변 누계
+        self._closed = []            # 마감된 월 (오름차순, 연속)
+        self._lock = threading.Lock()
+        self._repository = repository
+        self.version = 0
+
+    @classmethod
+    def from_repository(cls, repository, chart=CHART_OF_ACCOUNTS):
+        """저장된 전표를 다시 전기하고 마감 월까지 마감한 분개장"""
+        journal = cls(chart)
+        entries, lines, closes = repository.read()
+        if len(entries):
+            journal.post_many(
+                entries["date"], lines["entry_id"].to_numpy() - int(entries["id"].iloc[0]), lines["account"],
+                lines["debit"], lines["credit"], entries["memo"].tolist(),
+            )
+        if closes:
+            journal.close_period(closes[-1])
+        journal._repository = repository
+        return journal
+
+    def _transaction(self):
+        # 저장소 트랜잭션을 분개장 lock보다 먼저 잡는다 (재고 자동 전기와 같은 순서)
+        return self._repository.transaction() if self._repository is not None else nullcontext()
+
+    def __len__(self):
+        return len(self._entry)
+
+    def entry_count(self):
+        return len(self._memos)
+
+    def _code(self, account):
+        try:
+            return self._codes[account]
+        except KeyError:
+            raise ValueError(f"계정과목표에 없는 계정: {account}") from None
+
+    # -----------------------------
+    # 전기
+    # -----------------------------
+
+    def post(self, date, lines, memo=""):
+        """전표 한 건 전기. lines는 (계정, 차변, 대변) 목록이고 차변 합계와 대변 합계가 같아야 한다"""
+        if not lines:
+            raise ValueError("전표 라인이 없습니다.")
+        codes = [self._code(account) for account, _, _ in lines]
+        debits = [int(round(debit or 0)) for _, debit, _ in lines]
+        credits = [int(round(credit or 0)) for _, _, credit in lines]
+        if min(debits + credits) < 0:
+            raise ValueError("차변/대변 금액은 음수일 수 없습니다.")
+        if sum(debits) != sum(credits):
+            raise ValueError(f"차대 불일치: 차변 {sum(debits):,} / 대변 {sum(credits):,}")
+
+        date = pd.Timestamp(date).to_datetime64()
+        with self._transaction(), self._lock:
+            self._check_open(date)
+            entry_id = len(self._memos)
+            if self._repository is not None:
+                accounts = [account for account, _, _ in lines]
+                self._repository.append_entries(entry_id, [date], [0] * len(lines), accounts, debits, credits, [memo])
+            self._memos.append(memo)
+            self._entry.extend([entry_id] * len(lines))
+            self._date.extend([date] * len(lines))
+            self._account.extend(codes)
+            self._debit.extend(debits)
+            self._credit.extend(credits)
+            for code, debit, credit in zip(codes, debits, credits):
+                self._balances[code] += debit - credit
+            self._add_months(np.array([date] * len(lines)), np.array(codes), np.array(debits) - np.array(credits))
+            self.version += 1
+            return entry_id
+
+    def post_many(self, dates, entry_index, accounts, debits, credits, memos):
+        """여러 전표를 배열로 한 번에 전기
+
+        dates/memos는 전표별, entry_index/accounts/debits/credits는 라인별 배열이며
+        entry_index는 각 라인이 속한 전표의 위치(0..전표 수-1)다. 전기된 전표번호 배열을 반환한다.
+        """
+        dates = pd.to_datetime(pd.Series(dates)).to_numpy(dtype="datetime64[ns]")
+        entry_index = np.asarray(entry_index, dtype="int64")
+        debits = np.rint(np.asarray(debits, dtype="float64")).astype("int64")
+        credits = np.rint(np.asarray(credits, dtype="float64")).astype("int64")
+        codes = self.accounts.get_indexer(pd.Index(accounts))
+        if len(entry_index) == 0:
+            return np.empty(0, dtype="int64")
+        if (codes < 0).any():
+            unknown = sorted(set(np.asarray(accounts, dtype=object)[codes < 0]))
+            raise ValueError(f"계정과목표에 없는 계정: {unknown}")
+        if (debits < 0).any() or (credits < 0).any():
+            raise ValueError("차변/대변 금액은 음수일 수 없습니다.")
+        net = np.zeros(len(dates), dtype="int64")
+        np.add.at(net, entry_index, debits - credits)
+        if np.any(net != 0):
+            bad = int(np.flatnonzero(net)[0])
+            raise ValueError(f"차대 불일치 전표 {np.count_nonzero(net)}건 (첫 번째: {bad}번째 전표)")
+
+        with self._transaction(), self._lock:
+            self._check_open(dates.min())
+            first = len(self._memos)
+            self._store(dates, entry_index, codes, debits, credits, memos)
+            return np.arange(first, first + len(dates))
+
+    def _store(self, dates, entry_index, codes, debits, credits, memos):
+        # 저장소에 먼저 쓰고(실패하면 메모리는 그대로) 라인 배열/계정 누계/월별 합계에 반영 (lock 안에서 호출)
+        first = len(self._memos)
+        if self._repository is not None:
+            self._repository.append_entries(first, dates, entry_index, self.accounts[codes], debits, credits, memos)
+        self._memos.extend(memos)
+        self._entry.extend(entry_index + first)
+        self._date.extend(dates[entry_index])
+        self._account.extend(codes)
+        self._debit.extend(debits)
+        self._credit.extend(credits)
+        np.add.at(self._balances, codes, debits - credits)
+        self._add_months(dates[entry_index], codes, debits - credits)
+        self.version += 1
+
+    def _add_months(self, line_dates, codes, amounts):
+        # 방금 추가한 라인들을 월별 합계/월별 라인 위치에 반영 (lock 안에서 호출)
+        start = len(self._entry) - len(codes)
+        months = line_dates.astype("datetime64[M]")
+        if (months == months[0]).all():
+            keys, groups = months[:1], [np.arange(len(codes))]
+        else:
+            keys, inverse = np.unique(months, return_inverse=True)
+            order = np.argsort(inverse, kind="stable")
+            groups = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+        for key, rows in zip(keys, groups):
+            month = str(key)
+            totals = self._monthly.setdefault(month, np.zeros(len(self.accounts), dtype="int64"))
+            np.add.at(totals, codes[rows], amounts[rows])
+            self._month_lines.setdefault(month, []).append(rows + start)
+
+    # -----------------------------
+    # 기간 마감
+    # -----------------------------
+
+    def months(self):
+        """전기된 라인이 있는 월 목록"""
+        return sorted(self._monthly)
+
+    def closed_through(self):
+        """마지막 마감 월 ("YYYY-MM") 또는 None"""
+        return self._closed[-1] if self._closed else None
+
+    def open_from(self):
+        """전기 가능한 첫 시각 (마감 월 다음 달 1일) 또는 None"""
+        if not self._closed:
+            return None
+        return pd.Timestamp(np.datetime64(self._closed[-1], "M") + 1)
+
+    def _check_open(self, date):
+        if self._closed and str(np.datetime64(date, "M")) <= self._closed[-1]:
+            raise ValueError(f"마감된 기간({self._closed[-1]}까지)에는 전기할 수 없습니다: {pd.Timestamp(date):%Y-%m-%d}")
+
+    def close_period(self, month):
+        """month("YYYY-MM")까지 월별로 마감해 월말 잔액 스냅샷을 저장. 마감된 월에는 더 이상 전기할 수 없다"""
+        month = np.datetime64(month, "M")
+        with self._transaction(), self._lock:
+            last = self.closed_through()
+            if last is not None and month <= np.datetime64(last, "M"):
+                raise ValueError(f"이미 마감된 기간입니다: {month}")
+            if last is not None:
+                first = np.datetime64(last, "M") + 1
+                running = self._snapshots[last].copy()
+            else:
+                first = min([np.datetime64(m, "M") for m in self._monthly] + [month])
+                running = np.zeros(len(self.accounts), dtype="int64")
+            snapshots = {}
+            for key in np.arange(first, month + 1):
+                key = str(key)
+                if key in self._monthly:
+                    running += self._monthly[key]
+                snapshots[key] = running.copy()
+            if self._repository is not None:
+                self._repository.add_closes(list(snapshots))
+            self._snapshots.update(snapshots)
+            self._closed.extend(snapshots)
+            self.version += 1
+
+    def _month_positions(self, month):
+        parts = self._month_lines.get(month)
+        if not parts:
+            return np.empty(0, dtype="int64")
+        if len(parts) > 1:
+            self._month_lines[month] = parts = [np.concatenate(parts)]
+        return parts[0]
+
+    def _raw_as_of(self, when):
+        # when 시점까지의 계정별 차변 - 대변 누계 = 직전 마감 스냅샷 + 이후 월 합계 + 당월 라인
+        when = pd.Timestamp(when).to_datetime64()
+        month = str(np.datetime64(when, "M"))
+        i = bisect_left(self._closed, month)
+        base = self._closed[i - 1] if i else None
+        result = self._snapshots[base].copy() if base else np.zeros(len(self.accounts), dtype="int64")
+        for key, totals in self._monthly.items():
+            if (base is None or key > base) and key < month:
+                result += totals
+        rows = self._month_positions(month)
+        rows = rows[self._date.view()[rows] <= when]
+        np.add.at(result, self._account.view()[rows], self._debit.view()[rows] - self._credit.view()[rows])
+        return result
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+
+    def balance(self, account):
+        """계정 잔액 (정상 잔액 방향 기준)"""
+        code = self._code(account)
+        return int(self._balances[code] * self._signs[code])
+
+    def _raw(self, when=None):
+        with self._lock:
+            return self._balances.copy() if when is None else self._raw_as_of(when)
+
+    def balances(self, when=None):
+        """계정별 잔액 Series (정상 잔액 방향 기준). when이 있으면 그 시점 잔액"""
+        return pd.Series(self._raw(when) * self._signs, index=self.accounts)
+
+    def net_income(self, when=None):
+        """수익 - 비용 누계"""
+        raw = self._raw(when)
+        is_pl = np.isin(self._class_codes, [ACCOUNT_CLASSES.index("수익"), ACCOUNT_CLASSES.index("비용")])
+        return int(-raw[is_pl].sum())
+
+    def balance_sheet(self, when=None):
+        """{구분: {계정: 잔액}} - 자본에는 당기순이익을 더해 차변/대변이 맞게 한다"""
+        balances = self.balances(when)
+        sheet = {
+            group: {account: int(value) for account, value, cls in zip(balances.index, balances, self.classes) if cls == group}
+            for group in BALANCE_GROUPS
+        }
+        sheet["자본"][NET_INCOME] = self.net_income(when)
+        return sheet
+
+    def totals(self, when=None):
+        """구분별 합계와 순자산 {"자산", "부채", "자본", "순자산"} (계정 누계/스냅샷에서 바로 계산)"""
+        by_class = np.zeros(len(ACCOUNT_CLASSES), dtype="int64")
+        np.add.at(by_class, self._class_codes, self._raw(when) * self._signs)
+        totals = {cls: int(by_class[i]) for i, cls in enumerate(ACCOUNT_CLASSES)}
+        result = {group: totals[group] for group in BALANCE_GROUPS}
+        result["자본"] += totals["수익"] - totals["비용"]
+        result["순자산"] = result["자산"] - result["부채"]
+        return result
+
+    def _frame(self, rows):
+        # rows: 라인 위치(슬라이스/불리언 마스크/정수 배열)
+        entry = self._entry.view()[rows]
+        codes = self._account.view()[rows]
+        memos = np.asarray(self._memos, dtype=object)
+        return pd.DataFrame({
+            "전표번호": entry,
+            "날짜": self._date.view()[rows],
+            "계정": pd.Categorical.from_codes(codes, categories=self.accounts),
+            "구분": pd.Categorical.from_codes(self._class_codes[codes], categories=ACCOUNT_CLASSES),
+            "차변": self._debit.view()[rows],
+            "대변": self._credit.view()[rows],
+            "적요": memos[entry] if len(entry) else np.empty(0, dtype=object),
+        })
+
+    def lines(self, start=None, end=None):
+        """[start, end) 구간 분개 라인 DataFrame"""
+        with self._lock:
+            dates = self._date.view()
+            mask = np.ones(len(dates), dtype=bool)
+            if start is not None:
+                mask &= dates >= pd.Timestamp(start).to_datetime64()
+            if end is not None:
+                mask &= dates < pd.Timestamp(end).to_datetime64()
+            return self._frame(mask)
+
+    def recent_lines(self, n=50):
+        """최근 n개 라인 (최신 전표가 위)"""
+        with self._lock:
+            return self._frame(slice(max(len(self._entry) - n, 0), None)).iloc[::-1].reset_index(drop=True)
@@ -0,0 +1,364 @@
+import threading
+import numpy as np
+import pandas as pd
+from core.schema import CATEGORY_COLUMNS, apply_schema, concat_ledger
+from core.indexes import StockIndex, LatestReceiptIndex, AsOfStockIndex
+from core.costing import CostLayers
+from core.rollups import KpiRollup
+from core.cube import LedgerCube
+from core.profit import monthly_profit
+from core.profiling import mark_miss
+
+# -----------------------------
+# 입출고 원장 정규화
+# -----------------------------
+NUMERIC_COLUMNS = ["수량", "입고단가", "출고단가"]
+
+def prepare_ledger(raw, cogs=None):
+    """날짜 datetime64 인덱스, 숫자형 단가/수량, 월 키가 채워진 원장 생성
+
+    cogs(raw 행 순서의 매출원가 배열)가 주어지면 매출원가 컬럼으로 붙인다.
+    """
+    df = raw.copy()
+    if cogs is not None:
+        df["매출원가"] = cogs
+    df["날짜"] = pd.to_datetime(df["날짜"])
+    # 연산용으로 int64 확장 (단가 × 수량 overflow 방지)
+    for col in NUMERIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int64")
+    df["월"] = df["날짜"].dt.to_period("M").astype(str)
+
+    df.index = pd.DatetimeIndex(df["날짜"].to_numpy())
+    return df.sort_index(kind="stable")
+
+def append_prepared(df, tail):
+    """정규화된 원장 뒤에 정규화된 행을 붙임 (범주형은 카테고리를 합쳐 dtype 유지)"""
+    if tail.empty:
+        return df
+    tail = tail.copy()
+    for col in CATEGORY_COLUMNS:
+        categories = df[col].cat.categories
+        if not tail[col].cat.categories.isin(categories).all():
+            # 새 카테고리가 있을 때만 기존 원장 컬럼을 바꾼다
+            categories = categories.union(tail[col].cat.categories)
+            df = df.assign(**{col: df[col].cat.set_categories(categories)})
+        tail[col] = tail[col].cat.set_categories(categories)
+    return pd.concat([df, tail])
+
+# -----------------------------
+# 원장 추가 버퍼
+# -----------------------------
+class LedgerBuffer:
+    """새 행은 리스트에 쌓아 두고 chunk_size마다 또는 조회 시 본 원장에 한 번에 합침
+
+    등록마다 원장 전체를 복사하던 pd.concat을 chunk 단위로 묶어 대량 입력이 O(n²)이 되지 않게 한다.
+    """
+
+    def __init__(self, frame, chunk_size=256):
+        self._frame = frame.reset_index(drop=True)
+        self._pending = []       # dict 행 또는 DataFrame 묶음 (등록 순서 유지)
+        self._pending_rows = 0
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return len(self._frame) + self._pending_rows
+
+    def append(self, row):
+        self._pending.append(row)
+        self._pending_rows += 1
+        self._maybe_compact()
+
+    def extend(self, rows):
+        if len(rows) == 0:
+            return
+        self._pending.append(rows)
+        self._pending_rows += len(rows)
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._pending_rows >= self.chunk_size:
+            self.compact()
+
+    @staticmethod
+    def _entries_frame(entries):
+        # dict 행/DataFrame 묶음 목록 → 스키마가 적용된 DataFrame 하나
+        pieces, rows = [], []
+        for entry in entries:
+            if isinstance(entry, dict):
+                rows.append(entry)
+                continue
+            if rows:
+                pieces.append(apply_schema(pd.DataFrame(rows)))
+                rows = []
+            pieces.append(apply_schema(entry))
+        if rows:
+            pieces.append(apply_schema(pd.DataFrame(rows)))
+        # 묶음마다 카테고리가 달라 concat하면 object가 되므로 합친 뒤 스키마를 다시 적용
+        return pieces[0] if len(pieces) == 1 else apply_schema(pd.concat(pieces, ignore_index=True))
+
+    def compact(self):
+        """쌓인 행을 본 원장에 한 번의 concat으로 합침"""
+        if not self._pending:
+            return
+        self._frame = concat_ledger(self._frame, self._entries_frame(self._pending))
+        self._pending = []
+        self._pending_rows = 0
+
+    def since(self, position):
+        """등록 순서로 position번째 행부터 - 본 원장에 이미 합쳐진 행이 아니면 compact하지 않는다"""
+        need = len(self) - position
+        if need <= 0:
+            return self._frame.iloc[:0]
+        if need > self._pending_rows:
+            return self.frame().iloc[position:]
+        # 끝에서부터 need행을 덮는 항목만 변환
+        entries, rows = [], 0
+        for entry in reversed(self._pending):
+            entries.append(entry)
+            rows += 1 if isinstance(entry, dict) else len(entry)
+            if rows >= need:
+                break
+        return self._entries_frame(entries[::-1]).iloc[rows - need:]
+
+    def frame(self):
+        """버퍼에 남은 행까지 포함한 원장"""
+        self.compact()
+        return self._frame
+
+# -----------------------------
+# 프로세스 공용 원장 저장소
+# -----------------------------
+class LedgerStore:
+    """모든 세션이 공유하는 원장. 등록 시 version이 올라가고 정규화본은 version이 바뀔 때만 재생성
+
+    repository가 있으면 등록은 저장소에 먼저 기록되고, 다른 프로세스가 추가한 행은 조회 시 반영된다.
+    """
+
+    def __init__(self, raw, repository=None, last_id=0, cost_method="fifo"):
+        self._buffer = LedgerBuffer(raw)
+        self._repository = repository
+        self._last_id = last_id
+        self._lock = threading.Lock()
+        self.version = 0
+        self._prepared = None
+        self._prepared_version = -1
+        self._prepared_rows = 0           # 정규화본에 들어간 원장 행 수 (등록 순서 기준)
+        self._prepared_generation = -1    # 정규화본을 만들 때의 원가 재계산 세대
+        self._cost_generation = 0
+        self._asof = None
+        self._asof_version = -1
+        self._cube = None
+        self._cube_version = -1
+        self._monthly_profit = None
+        self._monthly_profit_version = -1
+        self.stock = StockIndex.build(raw)
+        self.receipts = LatestReceiptIndex.build(raw)
+        self.cost_method = cost_method
+        self._rebuild_costs(raw)
+
+    @classmethod
+    def from_repository(cls, repository):
+        raw, last_id = repository.read()
+        return cls(raw, repository=repository, last_id=last_id)
+
+    def _sync(self):
+        if self._repository is None or self._repository.last_id() == self._last_id:
+            return
+        new_rows, self._last_id = self._repository.read(after_id=self._last_id)
+        self._buffer.extend(new_rows)
+        self.stock.apply(new_rows)
+        self.receipts.apply(new_rows)
+        self._apply_batch(new_rows)
+        self.version += 1
+
+    def _rebuild_costs(self, frame):
+        # 원가층과 원가가 들어가는 KPI 집계를 처음부터 다시 계산
+        self.costing = CostLayers(self.cost_method)
+        self._cogs = [self.costing.process(frame)]
+        self.rollups = KpiRollup.build(frame, self._cogs[0])
+        self._costs_stale = False
+        self._cost_generation += 1
+
+    def _ensure_costs(self):
+        if self._costs_stale:
+            mark_miss()
+            self._rebuild_costs(self._buffer.frame())
+
+    def _apply_batch(self, df):
+        # 이전 날짜로 소급된 행이 있으면 다음 조회 때 원가층/집계를 처음부터 다시 계산
+        if self._costs_stale or df.empty:
+            return
+        if not self.costing.is_in_order(pd.to_datetime(df["날짜"]).min()):
+            self._costs_stale = True
+            return
+        cogs = self.costing.process(df)
+        self._cogs.append(cogs)
+        self.rollups.apply(df, cogs)
+
+    def _current_cogs(self):
+        self._ensure_costs()
+        self._cogs = [np.concatenate(self._cogs)]
+        return self._cogs[0]
+
+    def raw(self):
+        with self._lock:
+            self._sync()
+            return self._buffer.frame()
+
+    def prepared(self):
+        with self._lock:
+            self._sync()
+            if self._prepared_version != self.version:
+                mark_miss()
+                self._refresh_prepared()
+            return self._prepared
+
+    def _refresh_prepared(self):
+        # 마지막 정규화 이후 등록된 행이 모두 기존 마지막 날짜 이후이고 원가 재계산이 없었으면
+        # 새 행만 정규화해 뒤에 붙인다 (본 원장 compact/전체 정렬 없음). 아니면 처음부터 다시 만든다.
+        cogs = self._current_cogs()
+        new_rows = self._buffer.since(self._prepared_rows) if self._prepared is not None else None
+        in_order = (
+            new_rows is not None
+            and self._prepared_generation == self._cost_generation
+            and (self._prepared.empty or new_rows.empty or new_rows["날짜"].min() >= self._prepared.index[-1])
+        )
+        if in_order:
+            tail = prepare_ledger(new_rows, cogs[self._prepared_rows:])
+            self._prepared = append_prepared(self._prepared, tail)
+            if self._asof is not None and self._asof_version == self._prepared_version:
+                self._asof.extend(tail)
+                self._asof_version = self.version
+        else:
+            self._prepared = prepare_ledger(self._buffer.frame(), cogs)
+        self._prepared_rows = len(cogs)
+        self._prepared_generation = self._cost_generation
+        self._prepared_version = self.version
+
+    def asof_index(self):
+        """현재 version 기준 시점 재고 인덱스 (version이 바뀔 때만 재구성)"""
+        prepared = self.prepared()
+        with self._lock:
+            if self._asof_version != self._prepared_version:
+                mark_miss()
+                self._asof = AsOfStockIndex.build(prepared)
+                self._asof_version = self._prepared_version
+            return self._asof
+
+    def cube(self):
+        """현재 version 기준 집계 큐브 (version이 바뀔 때만 재계산)"""
+        prepared = self.prepared()
+        with self._lock:
+            if self._cube_version != self._prepared_version:
+                mark_miss()
+                self._cube = LedgerCube.build(prepared)
+                self._cube_version = self._prepared_version
+            return self._cube
+
+    def monthly_profit(self):
+        """현재 version 기준 월별 수익 (version이 바뀔 때만 재계산)"""
+        prepared = self.prepared()
+        with self._lock:
+            if self._monthly_profit_version != self._prepared_version:
+                mark_miss()
+                self._monthly_profit = monthly_profit(prepared)
+                self._monthly_profit_version = self._prepared_version
+            return self._monthly_profit
+
+    def movements_after(self, when):
+        """when 시점(포함) 이후의 정규화된 입출고 (날짜순)"""
+        prepared = self.prepared()
+        return prepared.iloc[prepared.index.searchsorted(pd.Timestamp(when), side="left"):]
+
+    def receipt_history(self):
+        """정규화된 원장의 입고 (날짜, 품목명, 입고단가) 날짜순"""
+        prepared = self.prepared()
+        return prepared.loc[(prepared["구분"] == "입고").to_numpy(), ["날짜", "품목명", "입고단가"]]
+
+    def stock_as_of(self, item, when):
+        return self.asof_index().stock_as_of(item, when)
+
+    def valuation(self):
+        """품목별 재고 수량과 원가층 기준 재고 평가액"""
+        with self._lock:
+            self._sync()
+            self._ensure_costs()
+            return self.costing.valuation()
+
+    def kpi_summary(self, month):
+        """대시보드 지표 (집계값에서 바로 읽음)"""
+        with self._lock:
+            self._sync()
+            self._ensure_costs()
+            totals = self.rollups.month_totals(month)
+            return {
+                "거래처": self.rollups.supplier_count(),
+                "상품": self.rollups.item_count(),
+                "판매건수": totals["출고건수"],
+                "매출": totals["매출"],
+                "매출원가": totals["매출원가"],
+            }
+
+    def available_items(self):
+        """재고가 남아 있는 품목 → 현재 수량 (원장 크기와 무관하게 품목 수에 비례)"""
+        with self._lock:
+            self._sync()
+            return self.stock.available()
+
+    def latest_receipt(self, item):
+        """품목의 최근 입고 (입고단가, 납품업체명, 일시) 또는 None"""
+        with self._lock:
+            self._sync()
+            return self.receipts.lookup(item)
+
+    def movements_since(self, position):
+        """등록 순서로 position번째 행부터의 입출고와 각 행의 매출원가"""
+        with self._lock:
+            self._sync()
+            return self._buffer.since(position), self._current_cogs()[position:]
+
+    def cogs(self, stop=None):
+        """등록 순서로 앞에서 stop개 행의 현재 원가층 기준 매출원가 (입고 행은 0)"""
+        with self._lock:
+            self._sync()
+            return self._current_cogs()[:stop].copy()
+
+    def append(self, row):
+        with self._lock:
+            if self._repository is not None:
+                new_id = self._repository.append(row)
+                if new_id != self._last_id + 1:
+                    # 사이에 다른 프로세스가 추가한 행까지 함께 반영
+                    self._sync()
+                    return
+                self._last_id = new_id
+            self._buffer.append(row)
+            self.stock.apply_movement(row["품목명"], row["구분"], row["수량"])
+            if not self._costs_stale and self.costing.is_in_order(row["날짜"]):
+                cogs = self.costing.apply(row["품목명"], row["구분"], row["수량"], row["입고단가"], row["날짜"])
+                self._cogs.append(np.array([cogs]))
+                self.rollups.apply_movement(
+                    row["날짜"], row["품목명"], row["납품업체명"], row["구분"], row["수량"], row["출고단가"], cogs
+                )
+            else:
+                self._costs_stale = True
+            if row["구분"] == "입고":
+                self.receipts.apply_receipt(row["품목명"], row["입고단가"], row["납품업체명"], row["날짜"])
+            self.version += 1
+
+    def append_many(self, df):
+        """검증된 여러 행을 한 번에 등록 (저장소 한 트랜잭션, 인덱스 일괄 갱신)"""
+        if df.empty:
+            return
+        with self._lock:
+            if self._repository is not None:
+                new_id = self._repository.append_many(df)
+                if new_id != self._last_id + len(df):
+                    self._sync()
+                    return
+                self._last_id = new_id
+            self._buffer.extend(df)
+            self.stock.apply(df)
+            self.receipts.apply(df)
+            self._apply_batch(df)
+            self.version += 1
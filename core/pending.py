@@ -0,0 +1,159 @@
+import sqlite3
+import threading
+from datetime import datetime
+import pandas as pd
+from core.profit import margin_rate
+from core.repository import DB_PATH
+
+# -----------------------------
+# 입출고 대기열 (발주 입고 예정 / 수주 출고 예약)
+# -----------------------------
+PENDING_STATUSES = ["대기", "확정", "취소"]
+
+class PendingQueue:
+    """대기 중인 입고/출고. 상태별 건수는 메모리 카운터로 유지해 대시보드 조회가 O(1)
+
+    다른 프로세스(연결)가 DB를 바꾸면 PRAGMA data_version이 달라지므로 그때만 카운터를 다시 읽는다.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_io (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL CHECK (kind IN ('입고', '출고')),
+                item TEXT NOT NULL,
+                quantity INTEGER NOT NULL,
+                in_price INTEGER NOT NULL DEFAULT 0,
+                out_price INTEGER NOT NULL DEFAULT 0,
+                partner TEXT,
+                manager TEXT,
+                due_date TEXT,
+                reference TEXT,
+                status TEXT NOT NULL DEFAULT '대기',
+                created_at TEXT NOT NULL,
+                closed_at TEXT
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pending_status_kind ON pending_io (status, kind)")
+        self.conn.commit()
+        self._counts = {}
+        self._data_version = None
+        self._load_counts()
+
+    def _data_version_now(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _load_counts(self):
+        rows = self.conn.execute("SELECT status, kind, COUNT(*) FROM pending_io GROUP BY status, kind").fetchall()
+        self._counts = {(status, kind): n for status, kind, n in rows}
+        self._data_version = self._data_version_now()
+
+    def _refresh_counts(self):
+        # 이 연결의 커밋으로는 data_version이 바뀌지 않으므로, 바뀌었으면 다른 연결이 쓴 것
+        if self._data_version_now() != self._data_version:
+            self._load_counts()
+
+    def _bump(self, status, kind, delta):
+        self._counts[(status, kind)] = self._counts.get((status, kind), 0) + delta
+
+    def count(self):
+        """상태와 관계없는 전체 건수"""
+        with self._lock:
+            self._refresh_counts()
+            return sum(self._counts.values())
+
+    def counts(self, status="대기"):
+        """구분별 건수 → {"입고": n, "출고": m}"""
+        with self._lock:
+            self._refresh_counts()
+            return {kind: self._counts.get((status, kind), 0) for kind in ("입고", "출고")}
+
+    def add(self, kind, item, quantity, in_price=0, out_price=0, partner="", manager="", due_date=None, reference=""):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self.conn:
+            cursor = self.conn.execute("""
+                INSERT INTO pending_io (kind, item, quantity, in_price, out_price, partner, manager,
+                                        due_date, reference, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '대기', ?)
+            """, (kind, item, int(quantity), int(in_price), int(out_price), partner, manager,
+                  None if due_date is None else str(due_date), reference, now))
+            self._bump("대기", kind, 1)
+            return cursor.lastrowid
+
+    def entries(self, status="대기", kind=None):
+        """상태별 대기 목록 (예정일순)"""
+        where, params = "status = ?", [status]
+        if kind is not None:
+            where += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT * FROM pending_io WHERE {where} ORDER BY due_date, id", self.conn, params=params
+            )
+
+    def _close(self, pending_id, status):
+        # 대기 상태일 때만 상태 변경 → 같은 건을 두 번 확정하지 않음
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "SELECT * FROM pending_io WHERE id = ? AND status = '대기'", (pending_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE pending_io SET status = ?, closed_at = ? WHERE id = ? AND status = '대기'",
+                (status, now, pending_id)
+            )
+            record = dict(zip([c[0] for c in cursor.description], row))
+            self._bump("대기", record["kind"], -1)
+            self._bump(status, record["kind"], 1)
+            return record
+
+    def _reopen(self, record, status):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE pending_io SET status = '대기', closed_at = NULL WHERE id = ?", (record["id"],)
+            )
+            self._bump(status, record["kind"], -1)
+            self._bump("대기", record["kind"], 1)
+
+    def cancel(self, pending_id):
+        return self._close(pending_id, "취소") is not None
+
+    def confirm(self, pending_id, ledger, manager=None):
+        """대기 건을 실제 입출고로 등록. 출고는 재고가 부족하면 ValueError"""
+        record = self._close(pending_id, "확정")
+        if record is None:
+            raise ValueError("이미 처리되었거나 없는 대기 건입니다.")
+
+        try:
+            kind, item, quantity = record["kind"], record["item"], record["quantity"]
+            in_price, supplier = record["in_price"], record["partner"]
+            if kind == "출고":
+                if quantity > ledger.available_items().get(item, 0):
+                    raise ValueError("출고 수량이 재고를 초과합니다.")
+                latest = ledger.latest_receipt(item)
+                if latest is not None:
+                    in_price, supplier = latest[0], latest[1]
+
+            rate = margin_rate(in_price, record["out_price"]) if kind == "출고" else None
+            ledger.append({
+                "날짜": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "품목명": item,
+                "구분": kind,
+                "수량": quantity,
+                "입고단가": in_price,
+                "예상출고단가": "",
+                "출고단가": record["out_price"],
+                "마진율": rate if rate is not None else "",
+                "납품업체명": supplier,
+                "담당자명": manager or record["manager"],
+                "비고": f"대기 확정 ({record['reference']})" if record["reference"] else "대기 확정",
+            })
+        except Exception:
+            self._reopen(record, "확정")
+            raise
+        return record
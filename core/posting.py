@@ -0,0 +1,137 @@
+import threading
+from contextlib import nullcontext
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# 입출고 → 분개장 자동 전기
+# -----------------------------
+# 전표 한 건당 최대 4라인: 입고는 앞 2라인, 출고는 4라인 모두 사용
+RECEIPT_ACCOUNTS = ["재고자산", "매입채무", "", ""]
+SHIPMENT_ACCOUNTS = ["매출채권", "매출", "매출원가", "재고자산"]
+
+def movement_entries(df, cogs):
+    """입출고 행 → Journal.post_many 인자 (dates, entry_index, accounts, debits, credits, memos)
+
+    입고: 재고자산(차) / 매입채무(대) - 수량 × 입고단가
+    출고: 매출채권(차) / 매출(대) - 수량 × 출고단가, 매출원가(차) / 재고자산(대) - 원가층 매출원가
+    """
+    n = len(df)
+    is_out = (df["구분"] == "출고").to_numpy()
+    qty = df["수량"].to_numpy(dtype="int64")
+    purchase = qty * df["입고단가"].to_numpy(dtype="int64")
+    sales = qty * df["출고단가"].to_numpy(dtype="int64")
+    cogs = np.rint(np.asarray(cogs, dtype="float64")).astype("int64")
+    zero = np.zeros(n, dtype="int64")
+
+    accounts = np.where(is_out[:, None], SHIPMENT_ACCOUNTS, RECEIPT_ACCOUNTS)
+    debits = np.where(
+        is_out[:, None],
+        np.column_stack([sales, zero, cogs, zero]),
+        np.column_stack([purchase, zero, zero, zero]),
+    )
+    credits = np.where(
+        is_out[:, None],
+        np.column_stack([zero, sales, zero, cogs]),
+        np.column_stack([zero, purchase, zero, zero]),
+    )
+    # 쓰지 않는 칸과 금액이 0인 라인은 뺀다
+    used = (accounts != "") & ((debits != 0) | (credits != 0))
+    entry_index = np.repeat(np.arange(n), 4).reshape(n, 4)
+
+    memos = (
+        df["구분"].astype(str) + " " + df["품목명"].astype(str) + " " + df["수량"].astype(str) + "개"
+    ).tolist()
+    return df["날짜"].to_numpy(), entry_index[used], accounts[used], debits[used], credits[used], memos
+
+LATE_SUFFIX = " (마감 후 소급)"
+COGS_ADJUSTMENT_MEMO = "매출원가 조정 (소급 입출고 원가 재계산)"
+
+def cogs_adjustment_entries(dates, diff, open_from=None):
+    """행별 매출원가 차이(현재 - 전기분) → 일자별 조정 전표 (Journal.post_many 인자)
+
+    차이가 양수인 날은 매출원가(차) / 재고자산(대), 음수인 날은 반대로 전기한다.
+    open_from 이전 날짜의 차이는 open_from 하루에 모은다.
+    """
+    changed = diff != 0
+    days = pd.DatetimeIndex(dates[changed]).normalize()
+    if open_from is not None:
+        days = days.where(days >= open_from, open_from)
+    days = pd.Series(diff[changed]).groupby(days).sum()
+    days = days[days != 0]
+    amount = days.to_numpy(dtype="int64")
+    n = len(days)
+    accounts = np.where((amount > 0)[:, None], ["매출원가", "재고자산"], ["재고자산", "매출원가"])
+    debits = np.column_stack([np.abs(amount), np.zeros(n, dtype="int64")])
+    credits = debits[:, ::-1]
+    entry_index = np.repeat(np.arange(n), 2)
+    return days.index.to_numpy(), entry_index, accounts.ravel(), debits.ravel(), credits.ravel(), [COGS_ADJUSTMENT_MEMO] * n
+
+class InventoryPosting:
+    """원장 입출고를 분개장에 일괄 전기. 마지막으로 전기한 입출고 위치(watermark)를 기억해 새 행만 전기한다
+
+    전기는 watermark 이후 행에만 적용되므로 여러 번 호출해도 같은 입출고가 두 번 전기되지 않는다.
+    행별로 전기한 매출원가를 기억해 두고, 소급 입출고로 원가층이 다시 계산되어 값이 달라지면
+    그 차이를 매출원가/재고자산 조정 전표로 전기한다 (분개장 재고자산 = 원가층 재고 평가액).
+    마감된 기간 날짜의 입출고와 조정은 마감 다음 달 1일자로 전기한다.
+    repository(JournalRepository)가 있으면 전기한 행을 전표와 같은 트랜잭션으로 저장해 재시작 후에도 이어서 전기한다.
+    """
+
+    def __init__(self, ledger, journal, repository=None):
+        self.ledger = ledger
+        self.journal = journal
+        self._repository = repository
+        if repository is not None:
+            self._posted_dates, self._posted_cogs = repository.read_postings()
+        else:
+            self._posted_dates = np.empty(0, dtype="datetime64[ns]")   # 전기한 행의 입출고 일시
+            self._posted_cogs = np.empty(0, dtype="int64")             # 전기한 행의 매출원가
+        self.watermark = len(self._posted_cogs)
+        self._lock = threading.Lock()
+
+    def _transaction(self):
+        return self._repository.transaction() if self._repository is not None else nullcontext()
+
+    def _post(self, dates, entry_index, accounts, debits, credits, memos):
+        # 마감된 기간으로 소급된 전표는 마감 다음 달 1일자로 전기
+        open_from = self.journal.open_from()
+        if open_from is not None:
+            late = dates < open_from.to_datetime64()
+            dates = np.where(late, open_from.to_datetime64(), dates)
+            memos = [memo + LATE_SUFFIX if is_late else memo for memo, is_late in zip(memos, late)]
+        self.journal.post_many(dates, entry_index, accounts, debits, credits, memos)
+
+    def _adjust_cogs(self):
+        # 이미 전기한 행의 매출원가를 현재 원가층 기준으로 다시 읽어 차이만 조정 전표로 전기
+        if not self.watermark:
+            return
+        current = np.rint(self.ledger.cogs(self.watermark)).astype("int64")
+        diff = current - self._posted_cogs
+        if not diff.any():
+            return
+        entries = cogs_adjustment_entries(self._posted_dates, diff, self.journal.open_from())
+        with self._transaction():
+            if len(entries[0]):
+                self.journal.post_many(*entries)
+            if self._repository is not None:
+                changed = np.flatnonzero(diff)
+                self._repository.update_postings(changed, current[changed])
+        self._posted_cogs = current
+
+    def post(self):
+        """아직 전기하지 않은 입출고를 전기하고 전기한 행 수를 반환 (소급으로 바뀐 매출원가는 조정 전표로 전기)"""
+        with self._lock:
+            self._adjust_cogs()
+            df, cogs = self.ledger.movements_since(self.watermark)
+            if df.empty:
+                return 0
+            cogs = np.rint(np.asarray(cogs, dtype="float64")).astype("int64")
+            entries = movement_entries(df, cogs)
+            with self._transaction():
+                self._post(*entries)
+                if self._repository is not None:
+                    self._repository.append_postings(self.watermark, entries[0], cogs)
+            self._posted_dates = np.concatenate([self._posted_dates, entries[0].astype("datetime64[ns]")])
+            self._posted_cogs = np.concatenate([self._posted_cogs, cogs])
+            self.watermark += len(df)
+            return len(df)
@@ -0,0 +1,87 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+
+# -----------------------------
+# 구간별 실행 시간 기록 (rerun마다 어느 구간이 느린지)
+# -----------------------------
+# 파일 기록은 ERP_TIMING_LOG에 경로를 지정했을 때만 (기본은 메모리에만 기록)
+LOG_PATH = os.environ.get("ERP_TIMING_LOG", "")
+
+_log_lock = threading.Lock()
+_current = contextvars.ContextVar("current_section", default=None)
+
+def _append_log(record, path):
+    if not path:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def mark_miss():
+    """캐시된 계산의 본문에서 호출 → 지금 측정 중인 구간을 캐시 miss로 표시 (측정 중이 아니면 무시)"""
+    record = _current.get()
+    if record is not None:
+        record["cache"] = "miss"
+
+class Profiler:
+    """한 번의 rerun 동안 구간별 (시간, 처리 행 수, 캐시 hit/miss) 기록"""
+
+    def __init__(self, page, log_path=LOG_PATH):
+        self.page = page
+        self.log_path = log_path
+        self.run_id = uuid.uuid4().hex[:8]
+        self.records = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def section(self, name, rows=None, cached=False):
+        """with 블록 실행 시간 기록. 블록 안에서 record["rows"]로 처리 행 수를 채울 수 있다
+
+        cached=True면 hit으로 시작하고, 블록 안의 캐시 본문이 mark_miss()를 부르면 miss가 된다.
+        """
+        record = {"section": name, "rows": rows, "cache": "hit" if cached else None}
+        token = _current.set(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            _current.reset(token)
+            self._record(record)
+
+    def timed(self, name=None, cached=False):
+        """함수 호출을 한 구간으로 기록하는 데코레이터 (반환값에 len()이 있으면 행 수로 사용)"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.section(name or func.__name__, cached=cached) as record:
+                    result = func(*args, **kwargs)
+                    if record["rows"] is None and hasattr(result, "__len__"):
+                        record["rows"] = len(result)
+                    return result
+            return wrapper
+        return decorator
+
+    def _record(self, record):
+        record = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "run": self.run_id,
+            **record,
+        }
+        self.records.append(record)
+        _append_log(record, self.log_path)
+
+    def frame(self):
+        return pd.DataFrame(self.records, columns=["section", "seconds", "rows", "cache"])
+
+    def elapsed(self):
+        return time.perf_counter() - self._started
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# 수익/마진율 계산 (컬럼 단위 벡터 연산)
+# -----------------------------
+
+def _numeric(series):
+    # 빈칸/문자 → 0, float64 배열로 변환
+    return pd.to_numeric(series, errors="coerce").fillna(0).to_numpy(dtype="float64")
+
+def _month_key(df):
+    if "월" in df.columns:
+        return df["월"]
+    return pd.to_datetime(df["날짜"]).dt.to_period("M").astype(str)
+
+def compute_profit(df):
+    """출고 행은 출고단가 × 수량 - 매출원가, 나머지 행은 0인 수익 Series
+
+    매출원가 컬럼(원가층 계산 결과)이 없으면 행에 기록된 입고단가 × 수량을 원가로 쓴다.
+    """
+    is_out = (df["구분"] == "출고").to_numpy()
+    qty = _numeric(df["수량"])
+    out_price = _numeric(df["출고단가"])
+    if "매출원가" in df.columns:
+        cost = _numeric(df["매출원가"])
+    else:
+        cost = _numeric(df["입고단가"]) * qty
+
+    profit = np.where(is_out, out_price * qty - cost, 0.0)
+    return pd.Series(profit, index=df.index, name="수익")
+
+def compute_margin_rate(df):
+    """출고 행의 마진율(%) Series, 계산할 수 없는 행은 NaN"""
+    is_out = (df["구분"] == "출고").to_numpy()
+    in_price = _numeric(df["입고단가"])
+    out_price = _numeric(df["출고단가"])
+
+    valid = is_out & (in_price > 0) & (out_price > 0)
+    rate = np.full(len(df), np.nan)
+    rate[valid] = np.round((out_price[valid] - in_price[valid]) / in_price[valid] * 100, 2)
+    return pd.Series(rate, index=df.index, name="마진율")
+
+def margin_rate(in_price, out_price):
+    """단건 마진율(%) - 입고/출고 단가 중 하나라도 0 이하이면 None"""
+    if in_price <= 0 or out_price <= 0:
+        return None
+    return round((out_price - in_price) / in_price * 100, 2)
+
+# -----------------------------
+# 기간/품목별 수익 집계
+# -----------------------------
+
+def monthly_profit(df):
+    """월(YYYY-MM)별 수익 합계"""
+    profit = compute_profit(df)
+    return profit.groupby(_month_key(df).to_numpy()).sum().rename_axis("월")
+
+def daily_profit(df):
+    """일자별 수익 합계"""
+    profit = compute_profit(df)
+    days = pd.to_datetime(df["날짜"]).dt.normalize().to_numpy()
+    return profit.groupby(days).sum().rename_axis("날짜")
+
+def item_profit(df):
+    """품목별 수익 합계"""
+    profit = compute_profit(df)
+    return profit.groupby(df["품목명"].to_numpy()).sum().rename_axis("품목명")
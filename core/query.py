@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from core.schema import LEDGER_COLUMNS
+
+# -----------------------------
+# 원장 조회 (필터/정렬/페이지)
+# -----------------------------
+
+def filter_positions(df, start=None, end=None, items=None, kinds=None, suppliers=None):
+    """정규화된 원장(날짜순 정렬)에서 조건에 맞는 행 위치 배열 (날짜순)
+
+    날짜 구간은 정렬된 인덱스에서 이진 탐색으로 잘라내고, 나머지 조건은 그 구간에만 적용한다.
+    """
+    lo = 0 if start is None else df.index.searchsorted(pd.Timestamp(start), side="left")
+    hi = len(df) if end is None else df.index.searchsorted(pd.Timestamp(end), side="left")
+    window = df.iloc[lo:hi]
+
+    mask = np.ones(len(window), dtype=bool)
+    for col, values in (("품목명", items), ("구분", kinds), ("납품업체명", suppliers)):
+        if values:
+            mask &= window[col].isin(values).to_numpy()
+    return np.flatnonzero(mask) + lo
+
+def ledger_page(df, page=1, page_size=50, sort_by="날짜", ascending=False, **filters):
+    """필터/정렬 후 요청한 페이지의 행만 꺼냄 → (페이지 DataFrame, 전체 건수, 전체 페이지 수)"""
+    positions = filter_positions(df, **filters)
+    total = len(positions)
+    pages = max(1, -(-total // page_size))
+    page = min(max(1, page), pages)
+
+    if sort_by == "날짜":
+        # 이미 날짜순이므로 내림차순은 뒤집기만
+        ordered = positions if ascending else positions[::-1]
+    else:
+        keys = df[sort_by].iloc[positions].reset_index(drop=True)
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            # 카테고리 등록 순서가 아닌 가나다순으로 정렬 (코드 정렬이라 빠름)
+            keys = keys.cat.set_categories(sorted(keys.cat.categories))
+        order = keys.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        ordered = positions[order]
+
+    visible = ordered[(page - 1) * page_size: page * page_size]
+    columns = [col for col in LEDGER_COLUMNS + ["매출원가"] if col in df.columns]
+    return df.iloc[visible][columns].reset_index(drop=True), total, pages
@@ -0,0 +1,227 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from core.schema import LEDGER_COLUMNS, apply_schema
+
+# -----------------------------
+# SQLite 입출고 원장 저장소
+# -----------------------------
+DB_PATH = "inventory.db"
+
+# 원장 컬럼 ↔ DB 컬럼
+COLUMN_MAP = {
+    "날짜": "date",
+    "품목명": "item",
+    "구분": "kind",
+    "수량": "quantity",
+    "입고단가": "in_price",
+    "예상출고단가": "expected_price",
+    "출고단가": "out_price",
+    "마진율": "margin_rate",
+    "납품업체명": "supplier",
+    "담당자명": "manager",
+    "비고": "remark",
+}
+DB_COLUMNS = [COLUMN_MAP[col] for col in LEDGER_COLUMNS]
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _to_db_rows(df):
+    df = apply_schema(df)
+    df["날짜"] = df["날짜"].dt.strftime(DATE_FORMAT)
+    df = df.astype(object).where(df.notna(), None)
+    return list(df.itertuples(index=False, name=None))
+
+class LedgerRepository:
+    """입출고 원장 영속 저장소. 등록은 INSERT 한 번, 조회는 날짜/품목/구분 인덱스 사용"""
+
+    def __init__(self, path=DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS inventory_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                item TEXT NOT NULL,
+                kind TEXT NOT NULL CHECK (kind IN ('입고', '출고')),
+                quantity INTEGER NOT NULL,
+                in_price INTEGER NOT NULL DEFAULT 0,
+                expected_price INTEGER,
+                out_price INTEGER NOT NULL DEFAULT 0,
+                margin_rate REAL,
+                supplier TEXT,
+                manager TEXT,
+                remark TEXT
+            )
+        """)
+        # 이전 버전의 월 파티션 인덱스는 날짜 인덱스와 겹치므로 제거 (month 컬럼은 NULL 허용이라 그대로 둠)
+        self.conn.execute("DROP INDEX IF EXISTS idx_logs_month_date")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_date ON inventory_logs (date)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_item_date ON inventory_logs (item, date)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_kind_date ON inventory_logs (kind, date)")
+        self.conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM inventory_logs").fetchone()[0]
+
+    def last_id(self):
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM inventory_logs").fetchone()[0]
+
+    def append(self, row):
+        """한 건 추가 후 새 id 반환"""
+        return self.append_many(pd.DataFrame([row]))
+
+    def append_many(self, df):
+        """여러 건을 한 트랜잭션으로 추가 후 마지막 id 반환"""
+        rows = _to_db_rows(df)
+        if not rows:
+            return None
+        placeholders = ", ".join("?" for _ in DB_COLUMNS)
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT INTO inventory_logs ({', '.join(DB_COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+            return self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+    def read(self, start=None, end=None, item=None, kind=None, after_id=0):
+        """조건에 맞는 원장 조회 → (스키마 적용 DataFrame, 마지막 id)"""
+        where, params = ["id > ?"], [after_id]
+        if start is not None:
+            where.append("date >= ?")
+            params.append(pd.Timestamp(start).strftime(DATE_FORMAT))
+        if end is not None:
+            where.append("date < ?")
+            params.append(pd.Timestamp(end).strftime(DATE_FORMAT))
+        if item is not None:
+            where.append("item = ?")
+            params.append(item)
+        if kind is not None:
+            where.append("kind = ?")
+            params.append(kind)
+
+        with self._lock:
+            df = pd.read_sql_query(
+                f"SELECT id, {', '.join(DB_COLUMNS)} FROM inventory_logs "
+                f"WHERE {' AND '.join(where)} ORDER BY id",
+                self.conn, params=params
+            )
+        last_id = int(df["id"].max()) if not df.empty else after_id
+        df = df.drop(columns="id").rename(columns={v: k for k, v in COLUMN_MAP.items()})
+        return apply_schema(df), last_id
+
+# -----------------------------
+# SQLite 분개장 저장소 (전표, 마감 월, 재고 자동 전기 위치)
+# -----------------------------
+
+class JournalRepository:
+    """분개장 영속 저장소. 전표/라인은 추가만 하고, 재시작하면 Journal.from_repository로 다시 읽는다
+
+    transaction()은 중첩할 수 있어 전표와 재고 자동 전기 위치를 한 트랜잭션으로 묶는다.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS journal_entries (
+                id INTEGER PRIMARY KEY,
+                date TEXT NOT NULL,
+                memo TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS journal_lines (
+                entry_id INTEGER NOT NULL,
+                account TEXT NOT NULL,
+                debit INTEGER NOT NULL DEFAULT 0,
+                credit INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_journal_lines_entry ON journal_lines (entry_id);
+            CREATE TABLE IF NOT EXISTS journal_closes (
+                month TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS inventory_postings (
+                position INTEGER PRIMARY KEY,
+                date TEXT NOT NULL,
+                cogs INTEGER NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """가장 바깥 블록이 끝날 때 커밋, 예외가 나면 롤백"""
+        with self._lock:
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if not self._depth:
+                    self.conn.rollback()
+                raise
+            self._depth -= 1
+            if not self._depth:
+                self.conn.commit()
+
+    # 날짜는 초 단위 ISO 문자열로 저장 (numpy에서 바로 변환)
+    @staticmethod
+    def _dates_to_text(dates):
+        return np.datetime_as_string(np.asarray(dates, dtype="datetime64[s]"), unit="s").tolist()
+
+    def append_entries(self, first_id, dates, entry_index, accounts, debits, credits, memos):
+        """전표(dates/memos는 전표별, 나머지는 라인별 배열)를 first_id부터 번호를 매겨 추가"""
+        ids = np.arange(first_id, first_id + len(memos)).tolist()
+        with self.transaction():
+            self.conn.executemany(
+                "INSERT INTO journal_entries (id, date, memo) VALUES (?, ?, ?)",
+                zip(ids, self._dates_to_text(dates), memos)
+            )
+            self.conn.executemany(
+                "INSERT INTO journal_lines (entry_id, account, debit, credit) VALUES (?, ?, ?, ?)",
+                zip(
+                    (np.asarray(entry_index) + first_id).tolist(), np.asarray(accounts, dtype=object).tolist(),
+                    np.asarray(debits).tolist(), np.asarray(credits).tolist(),
+                )
+            )
+
+    def add_closes(self, months):
+        with self.transaction():
+            self.conn.executemany("INSERT INTO journal_closes (month) VALUES (?)", [(m,) for m in months])
+
+    def read(self):
+        """→ (전표 DataFrame [date, memo] (id순), 라인 DataFrame [entry_id, account, debit, credit], 마감 월 목록)"""
+        with self._lock:
+            entries = pd.read_sql_query("SELECT id, date, memo FROM journal_entries ORDER BY id", self.conn)
+            lines = pd.read_sql_query(
+                "SELECT entry_id, account, debit, credit FROM journal_lines ORDER BY rowid", self.conn
+            )
+            closes = [row[0] for row in self.conn.execute("SELECT month FROM journal_closes ORDER BY month")]
+        entries["date"] = pd.to_datetime(entries["date"])
+        return entries, lines, closes
+
+    def read_postings(self):
+        """전기한 입출고의 (일시 배열, 매출원가 배열) - 등록 순서"""
+        with self._lock:
+            df = pd.read_sql_query("SELECT date, cogs FROM inventory_postings ORDER BY position", self.conn)
+        return pd.to_datetime(df["date"]).to_numpy(dtype="datetime64[ns]"), df["cogs"].to_numpy(dtype="int64")
+
+    def append_postings(self, first_position, dates, cogs):
+        positions = range(first_position, first_position + len(cogs))
+        with self.transaction():
+            self.conn.executemany(
+                "INSERT INTO inventory_postings (position, date, cogs) VALUES (?, ?, ?)",
+                zip(positions, self._dates_to_text(dates), np.asarray(cogs).tolist())
+            )
+
+    def update_postings(self, positions, cogs):
+        with self.transaction():
+            self.conn.executemany(
+                "UPDATE inventory_postings SET cogs = ? WHERE position = ?",
+                zip(np.asarray(cogs).tolist(), np.asarray(positions).tolist())
+            )
@@ -0,0 +1,74 @@
+import streamlit as st
+from core.ledger import LedgerStore
+from core.repository import LedgerRepository, JournalRepository
+from core.pending import PendingQueue
+from core.hr import EmployeeRepository
+from core.documents import EmbeddingCache
+from core.journal import Journal
+from core.posting import InventoryPosting
+from core.accounting import OPENING_DATE, OPENING_MEMO, opening_lines
+from core.profiling import mark_miss
+
+# -----------------------------
+# 프로세스 공용 리소스 (모든 세션/페이지가 공유)
+# -----------------------------
+
+@st.cache_resource
+def get_ledger_repository():
+    mark_miss()
+    repository = LedgerRepository()
+    # 최초 실행 시 더미 데이터로 초기화
+    if repository.count() == 0:
+        from data import dummy_data
+        repository.append_many(dummy_data.inventory_logs)
+    return repository
+
+@st.cache_resource
+def get_ledger_store():
+    mark_miss()
+    return LedgerStore.from_repository(get_ledger_repository())
+
+@st.cache_resource
+def get_pending_queue():
+    mark_miss()
+    queue = PendingQueue()
+    # 최초 실행 시 더미 대기 건으로 초기화
+    if queue.count() == 0:
+        from data import dummy_data
+        for entry in dummy_data.pending_io:
+            queue.add(**entry)
+    return queue
+
+@st.cache_resource
+def get_employee_repository():
+    mark_miss()
+    repository = EmployeeRepository()
+    # 최초 실행 시 더미 직원/출퇴근 기록으로 초기화
+    if repository.count() == 0:
+        from data import dummy_data_management
+        repository.seed(dummy_data_management.employees_df, dummy_data_management.attendance_logs_df)
+    return repository
+
+@st.cache_resource
+def get_embedding_cache():
+    mark_miss()
+    return EmbeddingCache()
+
+@st.cache_resource
+def get_journal_repository():
+    mark_miss()
+    return JournalRepository()
+
+@st.cache_resource
+def get_journal():
+    mark_miss()
+    journal = Journal.from_repository(get_journal_repository())
+    # 최초 실행 시 기초 잔액 전표로 시작
+    if journal.entry_count() == 0:
+        journal.post(OPENING_DATE, opening_lines(), memo=OPENING_MEMO)
+    return journal
+
+@st.cache_resource
+def get_inventory_posting():
+    mark_miss()
+    return InventoryPosting(get_ledger_store(), get_journal(), get_journal_repository())
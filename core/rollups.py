@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+from core.schema import month_keys
+
+# -----------------------------
+# KPI 집계 (월 × 품목 × 납품업체)
+# -----------------------------
+ROLLUP_FIELDS = ["입고건수", "출고건수", "입고수량", "출고수량", "매출", "매출원가"]
+
+def _rollup_values(df, cogs):
+    is_out = (df["구분"] == "출고").to_numpy()
+    qty = df["수량"].to_numpy(dtype="float64")
+    out_price = pd.to_numeric(df["출고단가"], errors="coerce").fillna(0).to_numpy(dtype="float64")
+    cogs = np.zeros(len(df)) if cogs is None else np.asarray(cogs, dtype="float64")
+    return pd.DataFrame({
+        "입고건수": (~is_out).astype("int64"),
+        "출고건수": is_out.astype("int64"),
+        "입고수량": np.where(is_out, 0, qty),
+        "출고수량": np.where(is_out, qty, 0),
+        "매출": np.where(is_out, out_price * qty, 0),
+        "매출원가": np.where(is_out, cogs, 0),
+    })
+
+class KpiRollup:
+    """(월, 품목, 납품업체)별 건수/수량/매출/원가 합계. 입출고 등록마다 해당 칸만 갱신"""
+
+    def __init__(self):
+        self._cells = {}      # (월, 품목, 납품업체) → [ROLLUP_FIELDS 순서의 합계]
+        self._months = {}     # 월 → 합계
+        self._items = {}      # 품목 → 행 수
+        self._suppliers = {}  # 납품업체 → 행 수
+
+    @classmethod
+    def build(cls, df, cogs=None):
+        rollup = cls()
+        rollup.apply(df, cogs)
+        return rollup
+
+    def _add(self, key, values):
+        month, item, supplier = key
+        for target, k in ((self._cells, key), (self._months, month)):
+            cell = target.setdefault(k, [0] * len(ROLLUP_FIELDS))
+            for i, v in enumerate(values):
+                cell[i] += v
+        rows = values[0] + values[1]
+        self._items[item] = self._items.get(item, 0) + rows
+        if isinstance(supplier, str) and supplier:
+            self._suppliers[supplier] = self._suppliers.get(supplier, 0) + rows
+
+    def apply(self, df, cogs=None):
+        """여러 입출고 행을 한 번에 반영 (cogs는 df 행 순서의 매출원가)"""
+        if df.empty:
+            return
+        values = _rollup_values(df, cogs)
+        keys = [
+            month_keys(df["날짜"]),
+            df["품목명"].astype(object).to_numpy(),
+            df["납품업체명"].astype(object).fillna("").to_numpy(),
+        ]
+        sums = values.groupby(keys, sort=False).sum()
+        for key, *row in sums.itertuples(name=None):
+            self._add(key, row)
+
+    def apply_movement(self, when, item, supplier, kind, quantity, out_price, cogs=0.0):
+        """입출고 한 건 반영"""
+        is_out = kind == "출고"
+        quantity = int(quantity)
+        values = [
+            0 if is_out else 1,
+            1 if is_out else 0,
+            0 if is_out else quantity,
+            quantity if is_out else 0,
+            quantity * float(out_price or 0) if is_out else 0,
+            float(cogs) if is_out else 0,
+        ]
+        self._add((pd.Timestamp(when).strftime("%Y-%m"), item, supplier or ""), values)
+
+    def month_totals(self, month):
+        """월 합계 → {필드: 값}"""
+        return dict(zip(ROLLUP_FIELDS, self._months.get(month, [0] * len(ROLLUP_FIELDS))))
+
+    def item_count(self):
+        return sum(1 for n in self._items.values() if n > 0)
+
+    def supplier_count(self):
+        return sum(1 for n in self._suppliers.values() if n > 0)
+
+    def frame(self):
+        """집계 칸 전체를 DataFrame으로"""
+        index = pd.MultiIndex.from_tuples(list(self._cells), names=["월", "품목명", "납품업체명"])
+        return pd.DataFrame(list(self._cells.values()), index=index, columns=ROLLUP_FIELDS)
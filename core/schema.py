@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# 입출고 원장 컬럼 스키마
+# -----------------------------
+MOVEMENT_TYPES = ["입고", "출고"]
+
+LEDGER_SCHEMA = {
+    "날짜": "datetime64[ns]",
+    "품목명": "category",
+    "구분": pd.CategoricalDtype(MOVEMENT_TYPES),
+    "수량": "int32",
+    "입고단가": "int32",
+    "예상출고단가": "Int32",   # 출고 행은 비어 있음
+    "출고단가": "int32",
+    "마진율": "Float64",       # 입고 행은 비어 있음
+    "납품업체명": "category",
+    "담당자명": "category",
+    "비고": "string",          # 자유 입력이라 범주형으로 두면 카테고리가 끝없이 늘어남
+}
+
+LEDGER_COLUMNS = list(LEDGER_SCHEMA)
+CATEGORY_COLUMNS = [col for col, dtype in LEDGER_SCHEMA.items() if dtype == "category"]
+
+def _blank_to_na(series):
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        return series.replace("", pd.NA)
+    return series
+
+def apply_schema(df):
+    """원장 DataFrame을 LEDGER_SCHEMA 타입으로 변환 (빈칸 → 결측, 누락 컬럼 추가)"""
+    df = df.reindex(columns=LEDGER_COLUMNS)
+
+    unknown = set(df["구분"].dropna()) - set(MOVEMENT_TYPES)
+    if unknown:
+        raise ValueError(f"알 수 없는 구분 값: {sorted(unknown)}")
+
+    out = {}
+    for col, dtype in LEDGER_SCHEMA.items():
+        series = _blank_to_na(df[col])
+        if dtype == "datetime64[ns]":
+            out[col] = pd.to_datetime(series).astype(dtype)
+        elif dtype in ("int32", "Int32", "Float64"):
+            series = pd.to_numeric(series, errors="coerce")
+            if dtype == "int32":
+                series = series.fillna(0)
+            out[col] = series.astype(dtype)
+        else:
+            out[col] = series.astype(dtype)
+    return pd.DataFrame(out, index=df.index)
+
+def month_keys(dates):
+    """날짜 배열 → "YYYY-MM" 문자열 배열"""
+    months = pd.to_datetime(dates).to_numpy().astype("datetime64[M]")
+    return np.datetime_as_string(months, unit="M")
+
+def validate_ledger(df):
+    """스키마와 다른 컬럼이 있으면 ValueError"""
+    problems = []
+    for col, dtype in LEDGER_SCHEMA.items():
+        if col not in df.columns:
+            problems.append(f"{col}: 컬럼 없음")
+        elif not pd.api.types.is_dtype_equal(df[col].dtype, pd.api.types.pandas_dtype(dtype)) \
+                and not (dtype == "category" and isinstance(df[col].dtype, pd.CategoricalDtype)):
+            problems.append(f"{col}: {df[col].dtype} (기대값 {dtype})")
+    if problems:
+        raise ValueError("원장 스키마 불일치 - " + ", ".join(problems))
+    return df
+
+def concat_ledger(df, new_rows):
+    """범주형 카테고리를 합쳐서 dtype을 유지한 채 원장 뒤에 행 추가"""
+    new_rows = apply_schema(pd.DataFrame(new_rows))
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        categories = df[col].cat.categories.union(new_rows[col].cat.categories)
+        df[col] = df[col].cat.set_categories(categories)
+        new_rows[col] = new_rows[col].cat.set_categories(categories)
+    return pd.concat([df, new_rows], ignore_index=True)
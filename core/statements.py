@@ -0,0 +1,100 @@
+import pandas as pd
+from core.accounting import (
+    BALANCE_GROUPS, NORMAL_SIGN, OPENING_MEMO, CASH_ACCOUNT, INVESTING_ACCOUNTS, FINANCING_ACCOUNTS,
+)
+from core.journal import NET_INCOME
+
+# -----------------------------
+# 손익계산서 / 현금흐름표 (기간별 비교 열)
+# -----------------------------
+PERIOD_FREQS = {"월별": "M", "분기별": "Q", "연도별": "Y"}
+TOTAL_COLUMN = "합계"
+
+def _periods(start, end, freq):
+    # [start, end) 구간을 덮는 기간 목록
+    return pd.period_range(pd.Timestamp(start), pd.Timestamp(end) - pd.Timedelta(1, "ns"), freq=freq)
+
+def period_totals(journal, start, end, freq="M"):
+    """[start, end) 분개 라인을 계정 × 기간으로 한 번에 합산한 차변 - 대변 표 (기초 잔액 전표 제외)
+
+    행은 계정과목표의 모든 계정, 열은 구간을 덮는 모든 기간 - 라인이 없는 칸은 0.
+    """
+    lines = journal.lines(start, end)
+    lines = lines[lines["적요"] != OPENING_MEMO]
+    net = lines["차변"] - lines["대변"]
+    table = net.groupby([lines["계정"], lines["날짜"].dt.to_period(freq)], observed=True).sum().unstack(fill_value=0)
+    return table.reindex(index=journal.accounts, columns=_periods(start, end, freq), fill_value=0)
+
+def _finish(rows, total):
+    # 기간 열 이름을 문자열로 바꾸고 합계 열 추가
+    rows = rows.astype("int64")
+    rows.columns = rows.columns.astype(str)
+    rows[TOTAL_COLUMN] = total
+    return rows
+
+def balance_sheet_frame(journal, when=None):
+    """재무상태표 한 장 DataFrame (구분, 계정, 금액, 합계행)
+
+    구분마다 계정 행 뒤에 "총 구분" 합계 행이 오고, 마지막 행은 순자산.
+    """
+    sheet = journal.balance_sheet(when)
+    totals = journal.totals(when)
+    rows = []
+    for group in BALANCE_GROUPS:
+        rows += [(group, account, value, False) for account, value in sheet[group].items()]
+        rows.append((group, f"총 {group}", totals[group], True))
+    rows.append(("순자산", "순자산", totals["순자산"], True))
+    return pd.DataFrame(rows, columns=["구분", "계정", "금액", "합계행"])
+
+def income_statement(journal, start, end, freq="M"):
+    """기간별 손익계산서 DataFrame (행: 수익 계정, 수익 합계, 비용 계정, 비용 합계, 당기순이익)"""
+    classes = pd.Series(journal.classes, index=journal.accounts)
+    normal = period_totals(journal, start, end, freq).mul(classes.map(NORMAL_SIGN), axis=0)
+    by_class = normal.groupby(classes).sum()
+
+    rows = pd.concat([
+        normal[classes == "수익"],
+        by_class.loc[["수익"]].rename(index={"수익": "수익 합계"}),
+        normal[classes == "비용"],
+        by_class.loc[["비용"]].rename(index={"비용": "비용 합계"}),
+        (by_class.loc[["수익"]] - by_class.loc["비용"]).rename(index={"수익": NET_INCOME}),
+    ])
+    return _finish(rows, rows.sum(axis=1))
+
+def cash_flow_statement(journal, start, end, freq="M"):
+    """기간별 현금흐름표 DataFrame (간접법)
+
+    현금 외 계정의 차변 - 대변 증감에 -1을 곱하면 그 계정이 만든 현금 증감이 된다.
+    수익/비용 계정은 당기순이익으로 묶고, 재무상태표 계정은 활동별로 나눠 증감이 있는 계정만 보여준다.
+    """
+    raw = period_totals(journal, start, end, freq)
+    classes = pd.Series(journal.classes, index=journal.accounts)
+    flows = -raw.drop(CASH_ACCOUNT)
+    activity = pd.Series("영업", index=flows.index)
+    activity[activity.index.isin(INVESTING_ACCOUNTS)] = "투자"
+    activity[activity.index.isin(FINANCING_ACCOUNTS)] = "재무"
+    is_pl = classes[flows.index].isin(["수익", "비용"])
+
+    parts = [flows[is_pl].sum().to_frame(NET_INCOME).T]
+    for name in ["영업", "투자", "재무"]:
+        accounts = flows[~is_pl & (activity == name)]
+        accounts = accounts[(accounts != 0).any(axis=1)]
+        subtotal = flows[activity == name].sum().to_frame(f"{name}활동 현금흐름").T
+        parts += [accounts.rename(index=lambda account: f"{account} 증감"), subtotal]
+    change = flows.sum().to_frame("현금 증감").T
+
+    # 기말 현금은 기간 끝 시점 잔액(마감 스냅샷 사용), 기초 현금은 기말 - 증감
+    periods = raw.columns
+    last = pd.Timestamp(end) - pd.Timedelta(1, "ns")
+    closing = pd.Series(
+        [journal.balances(min(period.end_time, last))[CASH_ACCOUNT] for period in periods],
+        index=periods, dtype="int64",
+    )
+    opening = closing - change.iloc[0]
+    rows = pd.concat(parts + [change, opening.to_frame("기초 현금").T, closing.to_frame("기말 현금").T])
+
+    total = rows.sum(axis=1)
+    if len(periods):
+        total["기초 현금"] = opening.iloc[0]
+        total["기말 현금"] = closing.iloc[-1]
+    return _finish(rows, total)
@@ -1,4271 +1,23 @@
-import pandas as pd
-from datetime import datetime, timedelta
+from data.seed import INVENTORY_SEED, load_seed
 
-base_time = datetime.now()
+# 입출고 원장 시드는 data/inventory_logs.feather (컬럼형)에 있고,
+# 처음 inventory_logs에 접근할 때 메모리 매핑으로 읽는다.
+_inventory_logs = None
 
-inventory_logs = pd.DataFrame([
-    {
-        "날짜": "2025-01-01 09:31",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 90,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "강산소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-01 15:30",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 82,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "강산소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-02 09:09",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 127,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-02 15:01",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 109,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-03 09:24",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 96,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-03 15:55",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 80,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-04 09:48",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-04 15:51",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 73,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-05 09:30",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 121,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-05 15:37",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 70,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-06 09:03",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 119,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-06 15:20",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 41,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "우리소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-07 09:26",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 123,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "ㅇㅇ도금",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-07 15:50",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 33,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "ㅇㅇ도금",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-08 09:38",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 120,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "ㅇㅇ도금",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-08 15:17",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 114,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "ㅇㅇ도금",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-09 09:38",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 77,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-09 15:15",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 66,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-10 09:38",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 61,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-10 15:18",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 31,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-11 09:27",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 135,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-11 15:15",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 42,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-12 09:05",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 99,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-12 15:27",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 76,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-13 09:51",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 108,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-13 15:33",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 88,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-14 09:57",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 92,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-14 15:29",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 49,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-15 09:30",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 110,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-15 15:21",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 65,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-16 09:21",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 119,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-16 15:29",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 62,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-17 09:46",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 122,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-17 15:54",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 37,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-18 09:10",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 125,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-18 15:35",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 66,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-19 09:03",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 105,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-19 15:53",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 60,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-20 09:26",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 72,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-20 15:01",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 58,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-21 09:57",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 148,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-21 15:03",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 65,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-22 09:46",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 89,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-22 15:28",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 38,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-23 09:54",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 77,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-23 15:47",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 57,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-24 09:38",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 91,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-24 15:40",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 71,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-25 09:32",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 93,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-25 15:09",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 45,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-26 09:40",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 126,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-26 15:42",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 67,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-27 09:21",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 81,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-27 15:21",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-28 09:15",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 126,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-28 15:34",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 62,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-29 09:30",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 125,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-29 15:58",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 111,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-30 09:54",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 107,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-30 15:47",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 91,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-01-31 09:00",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 110,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-01-31 15:52",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 34,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-01 09:11",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 92,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-01 15:33",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-02 09:29",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 116,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-02 15:04",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 72,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-03 09:49",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 97,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-03 15:03",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 53,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-04 09:18",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 62,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-04 15:33",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 46,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-05 09:11",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 133,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-05 15:40",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 95,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-06 09:58",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 144,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-06 15:49",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 68,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-07 09:53",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 93,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-07 15:27",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 77,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-08 09:34",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 113,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-08 15:59",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 105,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-09 09:27",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 145,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-09 15:37",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 74,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-10 09:36",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 88,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-10 15:02",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 53,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-11 09:54",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 87,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-11 15:54",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 31,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-12 09:38",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 63,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-12 15:11",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 61,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-13 09:30",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 109,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-13 15:33",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 80,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-14 09:33",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 92,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-14 15:30",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-15 09:51",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 111,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-15 15:40",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 48,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-16 09:05",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 126,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-16 15:29",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 94,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-17 09:12",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 98,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-17 15:27",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 93,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-18 09:48",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 81,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-18 15:53",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 71,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-19 09:52",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 118,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-19 15:34",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 74,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-20 09:09",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 147,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-20 15:49",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 146,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-21 09:29",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 127,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-21 15:34",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 52,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-22 09:27",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 129,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-22 15:14",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 78,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-23 09:00",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 62,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-23 15:45",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 35,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-24 09:26",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 138,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-24 15:47",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-25 09:44",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 96,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-25 15:11",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 83,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-26 09:53",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 99,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-26 15:56",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 53,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-27 09:07",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 143,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-27 15:32",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 118,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-02-28 09:27",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 63,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-02-28 15:03",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 47,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-01 09:17",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 124,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-01 15:14",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 59,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-02 09:22",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 95,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-02 15:18",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 43,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-03 09:02",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 104,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-03 15:48",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 61,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-04 09:22",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 141,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-04 15:19",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-05 09:14",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 98,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-05 15:56",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 85,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-06 09:22",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 93,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-06 15:14",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 58,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-07 09:06",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-07 15:38",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 47,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-08 09:54",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 133,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-08 15:37",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 86,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-09 09:18",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 139,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-09 15:42",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 68,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-10 09:36",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 135,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-10 15:32",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 38,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-11 09:13",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 102,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-11 15:10",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 46,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-12 09:22",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 112,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-12 15:21",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 50,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-13 09:14",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 64,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-13 15:31",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-14 09:30",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 147,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-14 15:21",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 87,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-15 09:42",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 86,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-15 15:23",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 85,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-16 09:58",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 79,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-16 15:45",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 55,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-17 09:18",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 84,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-17 15:59",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 84,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-18 09:36",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 138,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-18 15:34",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 123,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-19 09:00",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 123,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-19 15:24",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 83,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-20 09:24",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 99,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-20 15:59",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 50,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-21 09:19",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 75,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-21 15:36",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 40,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-22 09:56",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 64,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-22 15:36",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 44,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-23 09:05",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 72,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-23 15:45",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 45,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-24 09:55",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 108,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-24 15:02",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 97,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-25 09:31",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 82,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-25 15:36",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 37,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-26 09:18",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 121,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-26 15:17",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 51,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-27 09:13",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 141,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-27 15:26",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 119,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-28 09:24",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 102,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-28 15:15",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-29 09:10",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 100,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-29 15:47",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 69,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-30 09:04",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-30 15:53",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-03-31 09:39",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 121,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-03-31 15:05",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 82,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-01 09:47",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 138,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-01 15:18",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 103,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-02 09:11",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 124,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-02 15:50",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 123,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-03 09:09",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 99,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-03 15:49",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 96,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-04 09:51",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 107,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-04 15:12",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 69,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-05 09:40",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 79,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-05 15:31",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 48,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-06 09:15",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 65,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-06 15:22",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 48,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-07 09:28",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 100,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-07 15:00",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 79,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-08 09:45",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 94,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-08 15:29",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 55,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-09 09:40",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 104,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-09 15:37",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 58,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-10 09:40",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 65,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-10 15:13",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 33,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-11 09:50",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 73,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-11 15:43",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 49,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-12 09:09",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 145,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-12 15:21",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 106,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-13 09:20",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 140,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-13 15:54",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 65,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-14 09:53",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 90,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-14 15:00",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 32,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-15 09:24",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 121,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-15 15:17",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 120,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-16 09:43",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 103,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-16 15:53",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 49,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-17 09:08",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 70,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-17 15:31",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 48,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-18 09:54",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 124,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-18 15:32",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 112,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-19 09:16",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 142,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-19 15:09",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 94,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-20 09:26",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 110,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-20 15:00",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 84,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-21 09:15",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 134,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-21 15:43",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 75,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-22 09:39",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 84,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-22 15:08",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 32,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-23 09:25",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 123,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-23 15:21",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-24 09:26",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 116,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-24 15:19",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 98,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-25 09:49",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 87,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-25 15:18",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 72,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-26 09:18",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 92,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-26 15:35",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 49,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-27 09:52",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-27 15:52",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 82,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-28 09:55",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 139,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-28 15:28",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 95,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-29 09:41",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 115,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-29 15:55",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 46,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-04-30 09:26",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 93,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-04-30 15:49",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 60,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-01 09:10",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 125,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-01 15:35",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 78,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-02 09:50",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 119,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-02 15:52",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 46,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-03 09:55",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 117,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-03 15:08",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 36,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-04 09:10",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 123,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-04 15:42",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 115,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-05 09:49",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 89,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-05 15:11",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 59,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-06 09:55",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 135,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-06 15:15",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 33,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-07 09:14",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 112,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-07 15:25",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 33,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-08 09:47",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 122,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-08 15:57",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 122,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-09 09:46",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 140,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-09 15:12",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-10 09:29",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 132,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-10 15:51",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 30,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-11 09:32",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-11 15:56",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 67,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-12 09:08",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 103,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-12 15:28",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 64,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-13 09:50",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 144,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-13 15:40",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 98,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-14 09:41",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 137,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-14 15:29",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 99,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-15 09:24",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 132,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-15 15:21",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 88,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-16 09:57",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 63,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-16 15:45",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 32,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-17 09:35",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 149,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-17 15:57",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 126,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-18 09:35",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 130,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-18 15:21",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 110,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-19 09:42",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 143,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-19 15:01",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 63,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-20 09:16",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 86,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-20 15:41",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 83,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-21 09:30",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 143,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-21 15:22",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 67,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-22 09:41",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 148,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-22 15:16",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 52,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-23 09:33",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 150,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-23 15:52",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 107,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-24 09:39",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 117,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-24 15:59",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 43,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-25 09:57",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 95,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-25 15:37",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 32,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-26 09:18",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 142,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-26 15:52",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 51,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-27 09:37",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 71,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-27 15:19",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 43,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-28 09:04",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 94,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-28 15:53",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 65,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-29 09:56",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 82,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-29 15:17",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 46,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-30 09:55",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 73,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-30 15:30",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 71,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-05-31 09:30",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 106,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-05-31 15:03",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 53,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-01 09:46",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 101,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-01 15:47",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 37,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-02 09:42",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 84,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-02 15:03",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 71,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-03 09:25",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 141,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-03 15:45",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 64,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-04 09:30",
-        "품목명": "알루미늄 0.8T",
-        "구분": "입고",
-        "수량": 69,
-        "입고단가": 4100,
-        "예상출고단가": 5980,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-04 15:15",
-        "품목명": "알루미늄 0.8T",
-        "구분": "출고",
-        "수량": 66,
-        "입고단가": 4100,
-        "예상출고단가": "",
-        "출고단가": 5980,
-        "마진율": 45.85,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-05 09:54",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 137,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-05 15:19",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 103,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-06 09:44",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 133,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-06 15:03",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 84,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-07 09:19",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 95,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-07 15:24",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 60,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-08 09:54",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 84,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-08 15:03",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 73,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-09 09:29",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "입고",
-        "수량": 72,
-        "입고단가": 4880,
-        "예상출고단가": 6780,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-09 15:15",
-        "품목명": "아연도금강판 1.0T",
-        "구분": "출고",
-        "수량": 33,
-        "입고단가": 4880,
-        "예상출고단가": "",
-        "출고단가": 6780,
-        "마진율": 38.93,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-10 09:35",
-        "품목명": "동판 0.5T",
-        "구분": "입고",
-        "수량": 62,
-        "입고단가": 3440,
-        "예상출고단가": 5469,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-10 15:50",
-        "품목명": "동판 0.5T",
-        "구분": "출고",
-        "수량": 36,
-        "입고단가": 3440,
-        "예상출고단가": "",
-        "출고단가": 5469,
-        "마진율": 58.98,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-11 09:46",
-        "품목명": "철판 1.2T",
-        "구분": "입고",
-        "수량": 131,
-        "입고단가": 2980,
-        "예상출고단가": 4720,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-11 15:57",
-        "품목명": "철판 1.2T",
-        "구분": "출고",
-        "수량": 97,
-        "입고단가": 2980,
-        "예상출고단가": "",
-        "출고단가": 4720,
-        "마진율": 58.39,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-12 09:41",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 73,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-12 15:10",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 71,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    },
-    {
-        "날짜": "2025-06-13 09:49",
-        "품목명": "스테인리스 2.0T",
-        "구분": "입고",
-        "수량": 148,
-        "입고단가": 3720,
-        "예상출고단가": 5590,
-        "출고단가": 0,
-        "마진율": "",
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "정기 계약 입고"
-    },
-    {
-        "날짜": "2025-06-13 15:43",
-        "품목명": "스테인리스 2.0T",
-        "구분": "출고",
-        "수량": 113,
-        "입고단가": 3720,
-        "예상출고단가": "",
-        "출고단가": 5590,
-        "마진율": 50.27,
-        "납품업체명": "금강소재",
-        "담당자명": "정하람",
-        "비고": "긴급 납품"
-    }
-])
+def __getattr__(name):
+    global _inventory_logs
+    if name == "inventory_logs":
+        if _inventory_logs is None:
+            _inventory_logs = load_seed(INVENTORY_SEED)
+        return _inventory_logs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# 입출고 대기 (발주 입고 예정 / 수주 출고 예약)
+pending_io = [
+    {"kind": "입고", "item": "알루미늄 0.8T", "quantity": 120, "in_price": 4100, "partner": "강산소재",
+     "manager": "정하람", "due_date": "2025-06-16", "reference": "PO-2025-0612"},
+    {"kind": "입고", "item": "철판 1.2T", "quantity": 90, "in_price": 2980, "partner": "금강소재",
+     "manager": "정하람", "due_date": "2025-06-17", "reference": "PO-2025-0613"},
+    {"kind": "출고", "item": "스테인리스 2.0T", "quantity": 60, "out_price": 5590, "partner": "금강소재",
+     "manager": "정하람", "due_date": "2025-06-16", "reference": "SO-2025-0611"},
+]
@@ -0,0 +1,237 @@
+import argparse
+import sqlite3
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from core.schema import apply_schema
+from core.repository import LedgerRepository
+from data.seed import write_seed
+
+# -----------------------------
+# 부하 테스트용 ERP 데이터 생성기 (seed가 같으면 항상 같은 결과)
+# -----------------------------
+ITEMS = {
+    # 품목명: 기본 입고단가
+    "알루미늄 0.8T": 4100, "아연도금강판 1.0T": 4880, "철판 1.2T": 2980,
+    "동판 0.5T": 3440, "스테인리스 2.0T": 3720, "알루미늄 1.5T": 5200,
+    "철판 2.3T": 3900, "스테인리스 1.0T": 3300, "황동판 0.8T": 6100, "갈바륨 0.6T": 2700,
+}
+SUPPLIERS = ["강산소재", "금강소재", "우리소재", "대한철강", "한빛메탈", "동양스틸"]
+REMARKS = {"입고": ["정기 계약 입고", "추가 발주"], "출고": ["긴급 납품", "샘플 출고"]}
+POSITIONS = ["사원", "대리", "과장", "차장", "부장", "임원"]
+DEPARTMENTS = ["경영팀", "물류팀", "인사팀", "영업팀", "전산팀", "마케팅팀"]
+SURNAMES = list("김이박최정강조윤장임한오서신권황안송류홍")
+GIVEN = list("민서지현준영수하람승기유나연우진호성경은혜")
+DOC_TOPICS = ["거래명세서", "발주서", "견적서", "세금계산서", "재고실사표", "납품확인서", "회의록"]
+
+def generate_employees(m, seed=0):
+    """직원 m명 (dummy_data_management.employees_df 형식)"""
+    rng = np.random.default_rng(seed)
+    surnames = rng.choice(SURNAMES, m)
+    given = rng.choice(GIVEN, (m, 2))
+    names = [s + "".join(g) for s, g in zip(surnames, given)]
+    join = pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 365 * 10, m), unit="D")
+    return pd.DataFrame({
+        "id": np.arange(1, m + 1),
+        "name": names,
+        "position": rng.choice(POSITIONS, m, p=[0.35, 0.25, 0.18, 0.12, 0.07, 0.03]),
+        "department": rng.choice(DEPARTMENTS, m),
+        "join_date": join.strftime("%Y-%m-%d"),
+        "email": [f"user{i:05d}@company.com" for i in range(1, m + 1)],
+    })
+
+def generate_attendance(employees, days=20, start="2025-06-02", seed=0):
+    """직원별 평일 출퇴근 기록 (dummy_data_management.attendance_logs_df 형식)"""
+    rng = np.random.default_rng(seed + 1)
+    workdays = pd.bdate_range(start, periods=days)
+    ids = np.repeat(employees["id"].to_numpy(), len(workdays))
+    dates = np.tile(workdays.to_numpy(), len(employees))
+    n = len(ids)
+
+    clock_in = dates + pd.to_timedelta(8 * 60 + 30 + rng.integers(0, 60, n), unit="min").to_numpy()
+    clock_out = dates + pd.to_timedelta(17 * 60 + 30 + rng.integers(0, 120, n), unit="min").to_numpy()
+    return pd.DataFrame({
+        "employee_id": ids,
+        "date": pd.DatetimeIndex(dates).strftime("%Y-%m-%d"),
+        "clock_in": pd.DatetimeIndex(clock_in).strftime("%Y-%m-%dT%H:%M:%S"),
+        "clock_out": pd.DatetimeIndex(clock_out).strftime("%Y-%m-%dT%H:%M:%S"),
+        "location": rng.choice(["본사", "재택"], n, p=[0.8, 0.2]),
+    })
+
+def generate_inventory(n, managers, start="2025-01-01", span_days=730, seed=0):
+    """입출고 n건 (원장 스키마). 날짜순으로 재고를 추적해 재고가 음수가 되는 출고는 만들지 않는다
+
+    n과 관계없이 start부터 span_days일 안에 고르게 흩어 놓는다 (n이 크면 하루 건수가 늘어난다).
+    """
+    rng = np.random.default_rng(seed + 2)
+    names = list(ITEMS)
+    base_price = np.array([ITEMS[name] for name in names], dtype="float64")
+
+    # 기간 안의 초 단위 시각을 n개 뽑아 정렬 (하루 평균 n / span_days건)
+    seconds = np.sort(rng.integers(0, span_days * 24 * 60 * 60, n))
+    dates = pd.Timestamp(start) + pd.to_timedelta(seconds, unit="s")
+    item_idx = rng.integers(0, len(names), n)
+    want_out = rng.random(n) < 0.55
+    qty = rng.integers(10, 150, n)
+    markup = rng.uniform(1.3, 1.6, n)
+    # 품목별 입고단가는 월 단위로 ±3% 내에서 움직임
+    months = (dates.year - dates[0].year) * 12 + dates.month - dates[0].month
+    drift = np.cumprod(1 + rng.uniform(-0.03, 0.03, (months.max() + 1, len(names))), axis=0)
+    in_price = np.round(base_price[item_idx] * drift[months, item_idx], -1).astype("int64")
+
+    kinds = np.empty(n, dtype=object)
+    in_col = np.zeros(n, dtype="int64")
+    out_col = np.zeros(n, dtype="int64")
+    expected = np.full(n, np.nan)
+    margin = np.full(n, np.nan)
+    stock = np.zeros(len(names), dtype="int64")
+    latest_in = base_price.astype("int64").copy()
+
+    for i in range(n):
+        item = item_idx[i]
+        if want_out[i] and stock[item] > 0:
+            q = min(qty[i], stock[item])
+            qty[i] = q
+            stock[item] -= q
+            kinds[i] = "출고"
+            in_col[i] = latest_in[item]
+            out_col[i] = round(latest_in[item] * markup[i], -1)
+            margin[i] = round((out_col[i] - in_col[i]) / in_col[i] * 100, 2)
+        else:
+            stock[item] += qty[i]
+            kinds[i] = "입고"
+            in_col[i] = latest_in[item] = in_price[i]
+            expected[i] = round(in_price[i] * markup[i], -1)
+
+    suppliers = rng.choice(SUPPLIERS, n)
+    remarks = np.where(kinds == "입고", rng.choice(REMARKS["입고"], n), rng.choice(REMARKS["출고"], n))
+    return apply_schema(pd.DataFrame({
+        "날짜": dates,
+        "품목명": np.array(names, dtype=object)[item_idx],
+        "구분": kinds,
+        "수량": qty,
+        "입고단가": in_col,
+        "예상출고단가": expected,
+        "출고단가": out_col,
+        "마진율": margin,
+        "납품업체명": suppliers,
+        "담당자명": rng.choice(managers, n),
+        "비고": remarks,
+    }))
+
+def generate_documents(k, employees, embedding_dim=1536, start="2025-01-01", seed=0):
+    """문서 k건 (dummy_data_document.document_dummy_data 형식, 임베딩은 단위 벡터)"""
+    rng = np.random.default_rng(seed + 3)
+    topics = rng.choice(DOC_TOPICS, k)
+    uploaders = employees.iloc[rng.integers(0, len(employees), k)]
+    registered = pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, 365 * 24 * 60, k), unit="min")
+    embeddings = rng.normal(size=(k, embedding_dim)).astype("float32")
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    item_names = list(ITEMS)
+
+    documents = []
+    for i in range(k):
+        uploader = uploaders.iloc[i]
+        item = item_names[i % len(item_names)]
+        body = (
+            f"문서번호: DOC-{i:06d}\n"
+            f"작성일자: {registered[i]:%Y-%m-%d}\n"
+            f"품목: {item} 외 {rng.integers(0, 5)}건\n"
+            f"거래처: {SUPPLIERS[i % len(SUPPLIERS)]}\n"
+            f"총 거래액: 약 {rng.integers(10, 999)}만원"
+        )
+        title = f"{topics[i]}_{uploader['name']}_{i:06d}"
+        documents.append({
+            "제목": title,
+            "파일명": f"{title}.txt",
+            "업로더": f"{uploader['name']} ({uploader['position']} / {uploader['department']})",
+            "등록일": f"{registered[i]:%Y-%m-%d %H:%M}",
+            "파일데이터": body.encode("utf-8"),
+            "요약": f"{topics[i]} - {item} 관련 문서입니다.",
+            "임베딩": embeddings[i].tolist(),
+            "본문": body,
+        })
+    return documents
+
+# -----------------------------
+# 앱 형식으로 저장
+# -----------------------------
+
+def write_employee_db(employees, attendance, path):
+    """인사 관리 페이지와 같은 employees / attendance_logs 테이블로 저장"""
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            position TEXT,
+            department TEXT,
+            join_date TEXT,
+            email TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS attendance_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            date TEXT,
+            clock_in TEXT,
+            clock_out TEXT,
+            location TEXT
+        )
+    """)
+    with conn:
+        conn.executemany(
+            "INSERT INTO employees (id, name, position, department, join_date, email) VALUES (?, ?, ?, ?, ?, ?)",
+            employees.astype(object).itertuples(index=False, name=None)
+        )
+        conn.executemany(
+            "INSERT INTO attendance_logs (employee_id, date, clock_in, clock_out, location) VALUES (?, ?, ?, ?, ?)",
+            attendance.astype(object).itertuples(index=False, name=None)
+        )
+    conn.close()
+
+OUTPUT_FILES = ["employee.db", "inventory.db", "inventory_logs.feather", "documents.pkl"]
+
+def clear_outputs(out_dir):
+    """이전 실행 결과 삭제 (DB에 이어 쓰면 직원 id가 겹치고 원장이 중복되므로 항상 새로 만든다)"""
+    for name in OUTPUT_FILES:
+        for path in (out_dir / name, out_dir / f"{name}-wal", out_dir / f"{name}-shm"):
+            path.unlink(missing_ok=True)
+
+def generate_all(out_dir, movements, employees, documents, days=20, span_days=730, seed=0):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    clear_outputs(out_dir)
+
+    employees_df = generate_employees(employees, seed)
+    attendance_df = generate_attendance(employees_df, days, seed=seed)
+    write_employee_db(employees_df, attendance_df, out_dir / "employee.db")
+
+    ledger = generate_inventory(movements, employees_df["name"].to_numpy(), span_days=span_days, seed=seed)
+    write_seed(ledger, out_dir / "inventory_logs.feather")
+    LedgerRepository(str(out_dir / "inventory.db")).append_many(ledger)
+
+    docs = generate_documents(documents, employees_df, seed=seed)
+    pd.to_pickle(pd.DataFrame(docs), out_dir / "documents.pkl")
+    return ledger, employees_df, attendance_df, docs
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 ERP 데이터 생성")
+    parser.add_argument("--movements", type=int, default=100_000, help="입출고 건수 (N)")
+    parser.add_argument("--employees", type=int, default=100, help="직원 수 (M)")
+    parser.add_argument("--documents", type=int, default=1_000, help="문서 수 (K)")
+    parser.add_argument("--days", type=int, default=20, help="출퇴근 기록 영업일 수")
+    parser.add_argument("--span-days", type=int, default=730, help="입출고 기간 (일, 건수가 늘면 하루 건수가 늘어남)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, required=True, help="출력 디렉터리 (이전에 생성한 파일은 덮어씀)")
+    args = parser.parse_args()
+
+    ledger, employees_df, attendance_df, docs = generate_all(
+        args.out, args.movements, args.employees, args.documents, args.days, args.span_days, args.seed
+    )
+    print(f"입출고 {len(ledger):,}건, 직원 {len(employees_df):,}명, "
+          f"출퇴근 {len(attendance_df):,}건, 문서 {len(docs):,}건 → {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from core.schema import apply_schema, validate_ledger
+
+# -----------------------------
+# 컬럼형 시드 데이터 (Feather, 비압축 → 메모리 매핑)
+# -----------------------------
+SEED_DIR = Path(__file__).parent
+INVENTORY_SEED = SEED_DIR / "inventory_logs.feather"
+
+def write_seed(df, path=INVENTORY_SEED):
+    """스키마가 적용된 원장을 비압축 Feather로 저장 (범주형은 사전 인코딩 유지)"""
+    table = pa.Table.from_pandas(apply_schema(df), preserve_index=False)
+    feather.write_feather(table, str(path), compression="uncompressed")
+
+def load_seed(path=INVENTORY_SEED):
+    """Feather 시드를 메모리 매핑으로 읽어 원장 DataFrame으로 반환
+
+    스키마대로 저장된 파일이면 결측 없는 숫자 컬럼은 복사하지 않고 매핑된 버퍼를 그대로 쓴다.
+    스키마가 다른 파일만 apply_schema로 변환한다.
+    """
+    table = feather.read_table(str(path), memory_map=True)
+    df = table.to_pandas(split_blocks=True)
+    try:
+        return validate_ledger(df)
+    except ValueError:
+        return validate_ledger(apply_schema(df))
+
+def generate_seed(rows, base=None):
+    """기본 시드의 입출고 패턴을 기본 기간 안에서 조금씩 밀며 겹쳐 rows행 원장 생성
+
+    반복마다 기간을 span / 반복 수만큼 밀어서 전체 기간은 기본 시드의 두 배를 넘지 않는다.
+    반복 하나하나의 재고는 음수가 되지 않고, 날짜순 정렬이 각 반복의 순서를 유지하므로 합친 재고도 음수가 되지 않는다.
+    """
+    base = load_seed() if base is None else base
+    base = base.sort_values("날짜", kind="stable").reset_index(drop=True)
+    span = (base["날짜"].max() - base["날짜"].min()).ceil("D") + pd.Timedelta(days=1)
+
+    repeats = -(-rows // len(base))
+    step = (span / repeats).floor("s")
+    offsets = np.repeat(np.arange(repeats), len(base))[:rows] * step.value
+    df = base.iloc[np.tile(np.arange(len(base)), repeats)[:rows]].reset_index(drop=True)
+    df["날짜"] = df["날짜"] + pd.to_timedelta(offsets, unit="ns")
+    return apply_schema(df.sort_values("날짜", kind="stable").reset_index(drop=True))
+
+def main():
+    parser = argparse.ArgumentParser(description="입출고 시드 데이터 생성")
+    parser.add_argument("--rows", type=int, required=True, help="생성할 입출고 행 수")
+    parser.add_argument("--out", type=Path, required=True, help="저장할 Feather 파일 경로")
+    args = parser.parse_args()
+
+    df = generate_seed(args.rows)
+    write_seed(df, args.out)
+    print(f"{len(df):,}행 → {args.out}")
+
+if __name__ == "__main__":
+    main()
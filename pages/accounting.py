@@ -1,6 +1,13 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, time, timedelta
+from html import escape
+from core.accounting import BALANCE_GROUPS, ADJUSTMENT_ACCOUNT, adjustment_lines
+from core.statements import PERIOD_FREQS, balance_sheet_frame, income_statement, cash_flow_statement
+from core.resources import get_journal, get_inventory_posting
+from core.debug import page_profiler, render_debug_panel
+
+profiler = page_profiler("accounting")
 
 # 스타일 설정
 st.markdown("""
@@ -11,69 +18,137 @@ st.markdown("""
         .footer { text-align: center; margin-top: 50px; font-size: 14px; color: #00796B; }
         .positive { color: green; }
         .negative { color: red; }
+        .statement { width: 100%; border-collapse: collapse; }
+        .statement td { padding: 4px 8px; border-bottom: 1px solid #E0E0E0; }
+        .statement td:last-child { text-align: right; }
+        .statement th { padding: 12px 8px 4px; text-align: left; font-size: 18px; }
+        .statement tr.total td { border-bottom: 2px solid #00796B; }
     </style>
 """, unsafe_allow_html=True)
 
-# 세션 초기화
-if 'transactions' not in st.session_state:
-    st.session_state.transactions = []
-    st.session_state.assets = {
-        '현금': 300000, '매출채권': 150000, '재고자산': 200000,
-        '선급금': 50000, '선급비용': 30000, '기타유동자산': 25000,
-        '건물': 500000, '토지': 600000, '기계장치': 400000
-    }
-    st.session_state.liabilities = {
-        '매입채무': 100000, '미지급금': 50000, '단기차입금': 80000,
-        '미지급비용': 30000, '선수금': 20000, '예수금': 15000,
-        '장기차입금': 120000, '사채': 100000, '충당부채': 40000, '기타비유동부채': 30000
-    }
-    st.session_state.equity = {
-        '자본금': 700000, '이익잉여금': 200000, '자본잉여금': 150000,
-        '기타포괄손익누계액': 50000, '자기주식': -10000
+# 공용 분개장 (기초 잔액 전표로 시작)
+with profiler.section("분개장 로드", cached=True):
+    journal = get_journal()
+
+# 재고 입출고 중 아직 전기하지 않은 행만 분개장에 반영
+with profiler.section("입출고 자동 전기") as timing:
+    timing["rows"] = get_inventory_posting().post()
+
+# 수동 입력 제출 - 위젯을 다시 그리기 전에 실행되므로 편집 표는 새 잔액으로 그려진다
+def submit_manual_entry(key, table):
+    edits = st.session_state[key]["edited_rows"]
+    changes = {
+        table.index[row]: int(cells["잔액"]) - int(table["잔액"].iloc[row])
+        for row, cells in edits.items() if cells.get("잔액") is not None
     }
+    lines = adjustment_lines(changes)
+    try:
+        if lines:
+            journal.post(datetime.now(), lines, memo="잔액 수동 수정")
+        st.session_state["manual_entry_message"] = ("success", "입력한 값이 반영되었습니다!")
+    except ValueError as e:
+        st.session_state["manual_entry_message"] = ("error", str(e))
 
-# 수동 입력 함수
+# 수동 입력 함수 - fragment 안에서만 다시 실행되고, 계정 수와 관계없이 편집 표 하나로 입력
+@st.fragment
+@profiler.timed("수동 입력")
 def manual_entry():
     st.markdown('<div class="section-header">항목별 값 수동 입력</div>', unsafe_allow_html=True)
+    if message := st.session_state.pop("manual_entry_message", None):
+        kind, text = message
+        (st.success if kind == "success" else st.error)(text)
+
+    # 차액은 조정 계정으로 들어가므로 조정 계정은 직접 수정하지 않음
+    editable = [cls in BALANCE_GROUPS and name != ADJUSTMENT_ACCOUNT for name, cls in zip(journal.accounts, journal.classes)]
+    table = pd.DataFrame({
+        "구분": pd.Series(journal.classes, index=journal.accounts)[editable],
+        "잔액": journal.balances()[editable],
+    })
+    # 전기할 때마다 version이 바뀌어 편집 내용이 초기화된다
+    key = f"manual_input_{journal.version}"
 
     with st.form("manual_input_form"):
-        for category, group in zip(
-            ['자산', '부채', '자본'],
-            [st.session_state.assets, st.session_state.liabilities, st.session_state.equity]
-        ):
-            st.subheader(category)
-            for name in group:
-                group[name] = st.number_input(f"{name}", value=group[name], key=f"{category}_{name}")
-
-        submitted = st.form_submit_button("입력 완료 ✅")
-        if submitted:
-            st.success("입력한 값이 반영되었습니다!")
+        st.caption(f"다른 항목 수정 시 차액은 {ADJUSTMENT_ACCOUNT}에 반영됩니다.")
+        st.data_editor(
+            table, key=key, disabled=["구분"],
+            column_config={"잔액": st.column_config.NumberColumn("잔액", format="localized", step=1, required=True)},
+            use_container_width=True,
+        )
+        st.form_submit_button("입력 완료 ✅", on_click=submit_manual_entry, args=(key, table))
+    return table
+
+# 월 마감 함수
+def period_close():
+    st.markdown('<div class="section-header">월 마감</div>', unsafe_allow_html=True)
+    closed = journal.closed_through()
+    st.caption(f"마감 완료: {closed}까지" if closed else "마감된 기간이 없습니다.")
+
+    # 이미 끝난 달 중 아직 마감하지 않은 달만 마감 가능
+    this_month = datetime.now().strftime("%Y-%m")
+    candidates = [m for m in journal.months() if m < this_month and (closed is None or m > closed)]
+    if not candidates:
+        return
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        close_month = st.selectbox("마감할 월 (이전 달까지 함께 마감)", candidates, index=len(candidates) - 1)
+    with col2:
+        if st.button("월 마감 🔒"):
+            with profiler.section("월 마감"):
+                journal.close_period(close_month)
+            st.success(f"{close_month}까지 마감되었습니다.")
+            st.rerun()
+
+# 재무상태표 표시용 HTML (계정마다 st.write를 부르지 않고 표 하나로 전송)
+TOTAL_ICONS = {"자산": "💰", "부채": "💳", "자본": "💵", "순자산": "💸"}
+
+def statement_html(frame):
+    rows, current = [], None
+    for group, account, value, is_total in frame.itertuples(index=False):
+        if group != current and not is_total:
+            rows.append(f'<tr class="group"><th colspan="2">{escape(group)}</th></tr>')
+            current = group
+        if is_total:
+            label = f"<b>{escape(account)}</b> {TOTAL_ICONS.get(group, '')}"
+            rows.append(f'<tr class="total"><td>{label}</td><td><b>{value:,.0f} 원</b></td></tr>')
+        else:
+            rows.append(f"<tr><td>{escape(account)}</td><td>{value:,.0f} 원</td></tr>")
+    return f'<table class="statement">{"".join(rows)}</table>'
 
 # 재무상태표 출력 함수
-def balance_sheet():
-    st.write("### 재무상태표")
-    total_assets = sum(st.session_state.assets.values())
-    total_liabilities = sum(st.session_state.liabilities.values())
-    total_equity = sum(st.session_state.equity.values())
-    net_assets = total_assets - total_liabilities
-
-    st.write(f"### 자산")
-    for name, value in st.session_state.assets.items():
-        st.write(f"{name}: {value:,.0f} 원")
-    st.write(f"**총 자산**: {total_assets:,.0f} 원 💰")
-
-    st.write(f"### 부채")
-    for name, value in st.session_state.liabilities.items():
-        st.write(f"{name}: {value:,.0f} 원")
-    st.write(f"**총 부채**: {total_liabilities:,.0f} 원 💳")
-
-    st.write(f"### 자본")
-    for name, value in st.session_state.equity.items():
-        st.write(f"{name}: {value:,.0f} 원")
-    st.write(f"**총 자본**: {total_equity:,.0f} 원 💵")
-
-    st.write(f"### 순자산")
-    st.write(f"**순자산**: {net_assets:,.0f} 원 💸")
+@profiler.timed("재무상태표")
+def balance_sheet(as_of=None):
+    st.write("### 재무상태표" + (f" ({as_of:%Y-%m-%d} 기준)" if as_of else ""))
+    when = None if as_of is None else datetime.combine(as_of, time.max)
+    frame = balance_sheet_frame(journal, when)
+    st.markdown(statement_html(frame), unsafe_allow_html=True)
+    return frame
+
+# 손익계산서/현금흐름표 출력 함수
+def period_statements():
+    st.markdown('<div class="section-header">손익계산서 · 현금흐름표</div>', unsafe_allow_html=True)
+    today = datetime.today().date()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        start = st.date_input("시작일", value=today.replace(month=1, day=1))
+    with col2:
+        end = st.date_input("종료일", value=today)
+    with col3:
+        freq = st.selectbox("비교 단위", list(PERIOD_FREQS))
+    if start > end:
+        st.warning("시작일이 종료일보다 늦습니다.")
+        return
+
+    # 종료일 당일까지 포함
+    end_exclusive = end + timedelta(days=1)
+    tab1, tab2 = st.tabs(["손익계산서", "현금흐름표"])
+    with tab1, profiler.section("손익계산서") as timing:
+        statement = income_statement(journal, start, end_exclusive, PERIOD_FREQS[freq])
+        timing["rows"] = statement.shape[1]
+        st.dataframe(statement.style.format("{:,.0f}"), use_container_width=True)
+    with tab2, profiler.section("현금흐름표") as timing:
+        statement = cash_flow_statement(journal, start, end_exclusive, PERIOD_FREQS[freq])
+        timing["rows"] = statement.shape[1]
+        st.dataframe(statement.style.format("{:,.0f}"), use_container_width=True)
 
 # 메인 UI 함수
 def main():
@@ -82,10 +157,20 @@ def main():
 
     manual_entry()
 
+    period_close()
+
+    as_of = st.date_input("기준일", value=datetime.today())
     if st.button("재무상태표 조회 📊"):
-        balance_sheet()
+        balance_sheet(as_of)
+
+    period_statements()
+
+    st.markdown('<div class="section-header">최근 분개</div>', unsafe_allow_html=True)
+    st.caption(f"전표 {journal.entry_count():,}건 · 분개 라인 {len(journal):,}개")
+    st.dataframe(journal.recent_lines(), use_container_width=True, hide_index=True)
 
     st.markdown('<div class="footer">회계 시스템을 사용해 주셔서 감사합니다! ✨</div>', unsafe_allow_html=True)
+    render_debug_panel(profiler)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+import streamlit as st
+import plotly.express as px
+from core.cube import CUBE_DIMENSIONS, CUBE_MEASURES
+from core.resources import get_ledger_store
+from core.debug import page_profiler, render_debug_panel
+
+st.set_page_config(page_title="입출고 분석", layout="wide")
+st.title("📊 입출고 분석")
+profiler = page_profiler("analytics")
+
+# -----------------------------
+# 집계 큐브 (원장 version이 바뀔 때만 재계산)
+# -----------------------------
+with profiler.section("집계 큐브", cached=True):
+    cube = get_ledger_store().cube()
+
+# -----------------------------
+# 피벗 설정
+# -----------------------------
+col1, col2, col3 = st.columns(3)
+with col1:
+    rows = st.multiselect("행 (드릴다운 순서)", CUBE_DIMENSIONS, default=["월"])
+with col2:
+    column = st.selectbox("열", ["없음"] + [dim for dim in CUBE_DIMENSIONS if dim not in rows], index=0)
+with col3:
+    measure = st.selectbox("측정값", CUBE_MEASURES, index=CUBE_MEASURES.index("수익"))
+
+column = None if column == "없음" else column
+
+# -----------------------------
+# 필터 (슬라이스)
+# -----------------------------
+with st.expander("🔎 필터"):
+    filter_cols = st.columns(len(CUBE_DIMENSIONS))
+    filters = {}
+    for dim, filter_col in zip(CUBE_DIMENSIONS, filter_cols):
+        with filter_col:
+            filters[dim] = st.multiselect(dim, cube.members(dim), key=f"cube_filter_{dim}")
+
+# -----------------------------
+# 결과
+# -----------------------------
+with profiler.section("피벗") as timing:
+    pivot = cube.pivot(rows, column, measure, filters)
+    timing["rows"] = len(pivot)
+st.dataframe(pivot, use_container_width=True)
+
+if rows:
+    chart_df = cube.rollup(rows[:1] + ([column] if column else []), filters)
+    fig = px.bar(
+        chart_df, x=rows[0], y=measure, color=column,
+        title=f"{rows[0]}별 {measure}" + (f" ({column} 구분)" if column else "")
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+render_debug_panel(profiler)
@@ -1,31 +1,28 @@
 import streamlit as st
 import datetime
 from openai import OpenAI
-from data import dummy_data_management as dummy
+from core.chat import DEFAULT_PROMPT, bot_prompts, generate_reply, last_message, conversation
+from core.resources import get_employee_repository
+from core.profiling import mark_miss
+from core.debug import page_profiler, render_debug_panel
 
 # 현재 사용자
 current_user = "이사원"
 
+profiler = page_profiler("chat")
+
 # 직원 정보
-employees_df = dummy.employees_df
+with profiler.section("직원 조회") as timing:
+    employees_df = get_employee_repository().employees()
+    timing["rows"] = len(employees_df)
 gpt_bots_df = employees_df[employees_df["name"] != current_user]
 gpt_bots = gpt_bots_df["name"].tolist()
 
-# GPT system prompt 생성
-def generate_prompt(row):
-    employee_list = "\n".join(
-        f"{r['name']} ({r['position']}, {r['department']}, {r['email']})"
-        for _, r in employees_df.iterrows()
-    )
-    return f"""당신은 {row['department']} 부서의 {row['position']} {row['name']}입니다.
-ERP 시스템에서 사용자와 대화하며 업무를 지원합니다.
-다음은 전체 직원 명단입니다:
-{employee_list}
-답변은 직책에 맞는 말투로 하세요."""
-
-bot_prompts = {
-    row["name"]: generate_prompt(row) for _, row in gpt_bots_df.iterrows()
-}
+# GPT system prompt (직원 명단이 바뀔 때만 다시 생성)
+@st.cache_data(show_spinner=False)
+def get_bot_prompts(employees, user):
+    mark_miss()
+    return bot_prompts(employees, user)
 
 # API 키 확인
 if "api_key" not in st.session_state or not st.session_state.api_key:
@@ -38,36 +35,12 @@ if "chat_history" not in st.session_state:
 
 # GPT 응답 생성 함수
 def generate_gpt_reply(bot_name, user_input):
-    try:
-        prompt = bot_prompts.get(bot_name, "당신은 회사 직원입니다.")
-
-        # 문서 연동: 업로더가 일치하는 문서만 참조
-        matched_docs = []
-        if "document_knowledge" in st.session_state:
-            matched_docs = [doc for doc in st.session_state.document_knowledge if doc.get("업로더") == bot_name]
-
-        if matched_docs:
-            doc_context = "\n\n".join(
-                f"[{doc['제목']} 요약]: {doc['요약']}\n[본문]: {doc.get('본문', '')[:1000]}"
-                for doc in matched_docs
-            )
-            prompt += f"\n\n다음은 {bot_name}님이 업로드한 문서입니다. 필요 시 참고하세요:\n{doc_context}"
-        elif "문서" in user_input or "내용" in user_input:
-            return f"그건 제가 업로드 한 문서가 아니라 잘 모르겠습니다."
-
-        client = OpenAI(api_key=st.session_state.api_key)
-        response = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_input}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        return f"(오류: {e})"
+    with profiler.section("봇 프롬프트", rows=len(employees_df), cached=True):
+        prompt = get_bot_prompts(employees_df, current_user).get(bot_name, DEFAULT_PROMPT)
+    # 문서 연동: 업로더가 일치하는 문서만 참조
+    documents = st.session_state.get("document_knowledge", [])
+    with profiler.section("GPT 응답", rows=len(documents)):
+        return generate_reply(OpenAI(api_key=st.session_state.api_key), prompt, bot_name, user_input, documents)
 
 # 직원 목록 → 채팅 선택
 if "selected_chat_target" not in st.session_state:
@@ -77,12 +50,7 @@ if "selected_chat_target" not in st.session_state:
 
     for name in gpt_bots:
         row = gpt_bots_df[gpt_bots_df["name"] == name].iloc[0]
-        last_msg = next(
-            (chat["message"] for chat in reversed(st.session_state.chat_history)
-             if chat["sender"] in (name, current_user) and
-             (chat.get("receiver") == name or chat.get("receiver") == current_user)),
-            "메시지 없음"
-        )
+        last_msg = last_message(st.session_state.chat_history, name, current_user)
         box = st.button(
             label=f"{name} ({row['position']}, {row['department']})\n최근: {last_msg[:50]}",
             key=f"btn_{name}",
@@ -106,25 +74,26 @@ else:
         st.rerun()
 
     # 대화 출력
-    for chat in st.session_state.chat_history:
-        if {chat.get("sender"), chat.get("receiver")} == {current_user, selected_bot}:
-            is_user = chat["sender"] == current_user
-            align = "flex-end" if is_user else "flex-start"
-            bg_color = "#DCF8C6" if is_user else "#F1F0F0"
-            st.markdown(
-                f"""
-                <div style='display: flex; justify-content: {align}; margin-bottom: 10px;'>
-                    <div style='background-color: {bg_color}; padding: 10px 15px; border-radius: 12px; max-width: 70%;'>
-                        <div style='font-weight: bold;'>{chat['sender']}</div>
-                        <div>{chat['message']}</div>
-                        <div style='font-size: 10px; color: gray; text-align: right;'>
-                            {chat['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}
-                        </div>
+    with profiler.section("대화 필터", rows=len(st.session_state.chat_history)):
+        messages = conversation(st.session_state.chat_history, current_user, selected_bot)
+    for chat in messages:
+        is_user = chat["sender"] == current_user
+        align = "flex-end" if is_user else "flex-start"
+        bg_color = "#DCF8C6" if is_user else "#F1F0F0"
+        st.markdown(
+            f"""
+            <div style='display: flex; justify-content: {align}; margin-bottom: 10px;'>
+                <div style='background-color: {bg_color}; padding: 10px 15px; border-radius: 12px; max-width: 70%;'>
+                    <div style='font-weight: bold;'>{chat['sender']}</div>
+                    <div>{chat['message']}</div>
+                    <div style='font-size: 10px; color: gray; text-align: right;'>
+                        {chat['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}
                     </div>
                 </div>
-                """,
-                unsafe_allow_html=True
-            )
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
 
     # 입력창
     user_input = st.chat_input("메시지를 입력하세요")
@@ -145,3 +114,5 @@ else:
             "timestamp": datetime.datetime.now()
         })
         st.rerun()
+
+render_debug_panel(profiler)
@@ -1,86 +1,53 @@
 import streamlit as st
 import pandas as pd
-import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from openai import OpenAI
-from data import dummy_data_management as dummy
 from data.dummy_data_document import document_dummy_data
-import fitz
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from core.documents import (
+    empty_documents, versioned_filename, extract_text_from_pdf, summarize_and_embed,
+    similarity, keyword_filter, rank_documents, sort_documents,
+)
+from core.resources import get_employee_repository, get_embedding_cache
+from core.profiling import mark_miss
+from core.debug import page_profiler, render_debug_panel
 
 st.set_page_config(page_title="문서 관리", layout="wide")
+profiler = page_profiler("document")
 
 if "api_key" not in st.session_state or not st.session_state.api_key:
     st.error("❌ 홈 화면에서 OpenAI API 키를 먼저 입력해 주세요.")
     st.stop()
 
 if 'documents' not in st.session_state:
-    st.session_state.documents = pd.DataFrame(columns=[
-        "제목", "파일명", "업로더", "등록일", "파일데이터", "요약", "임베딩", "본문"
-    ])
+    st.session_state.documents = empty_documents()
     dummy_df = pd.DataFrame(document_dummy_data)
     st.session_state.documents = pd.concat([dummy_df, st.session_state.documents], ignore_index=True)
 
-def get_versioned_filename(filename):
-    name, ext = re.match(r"(.+?)(\.[^.]+)?$", filename).groups()
-    ext = ext or ""
-    existing = st.session_state.documents["파일명"].tolist()
-    pattern = re.compile(f"{re.escape(name)}(?:_v(\\d+)){re.escape(ext)}")
-    versions = [int(m.group(1)) for f in existing if (m := pattern.match(f))]
-    if filename in existing:
-        versions.append(0)
-    new_version = max(versions) + 1 if versions else None
-    return filename if new_version is None else f"{name}_v{new_version}{ext}"
-
 @st.cache_data(show_spinner=False)
 def summarize_and_embed_with_gpt(title, text):
-    try:
-        client = OpenAI(api_key=st.session_state.api_key)
-        summary_resp = client.chat.completions.create(
-            model="gpt-4-1106-preview",
-            messages=[
-                {"role": "system", "content": "당신은 ERP 기업 문서 요약 도우미입니다. 문서 내용을 간결하게 요약하세요."},
-                {"role": "user", "content": text[:6000]}
-            ],
-            temperature=0.3
-        )
-        summary = summary_resp.choices[0].message.content.strip()
-        embedding_input = f"{title}\n\n{text[:8000]}"
-        emb_resp = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=embedding_input
-        )
-        embedding = emb_resp.data[0].embedding
-        return summary, embedding
-    except Exception as e:
-        return f"요약 실패: {e}", []
-
-def extract_text_from_pdf(file_bytes):
-    try:
-        pdf = fitz.open(stream=file_bytes, filetype="pdf")
-        return "\n".join(page.get_text() for page in pdf)
-    except Exception:
-        return ""
+    mark_miss()
+    return summarize_and_embed(OpenAI(api_key=st.session_state.api_key), title, text)
 
 st.title("📚 문서 등록 및 공유")
 
 with st.form("upload_form", clear_on_submit=True):
     st.subheader("📤 문서 업로드")
     uploaded_file = st.file_uploader("파일 선택", type=["pdf", "docx", "xlsx", "png", "jpg", "txt"])
-    uploader = st.selectbox("담당자 선택", dummy.employees_df["name"].tolist())
+    uploader = st.selectbox("담당자 선택", get_employee_repository().employees()["name"].tolist())
     submitted = st.form_submit_button("업로드")
 
     if submitted and uploaded_file and uploader:
-        filename = get_versioned_filename(uploaded_file.name)
+        filename = versioned_filename(uploaded_file.name, st.session_state.documents["파일명"].tolist())
         title = uploaded_file.name.rsplit('.', 1)[0]
         now_kst = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d %H:%M")
         file_bytes = uploaded_file.getvalue()
 
         if filename.lower().endswith(".pdf"):
-            text = extract_text_from_pdf(file_bytes)
-            summary, embedding = summarize_and_embed_with_gpt(title, text)
+            with profiler.section("PDF 텍스트 추출"):
+                text = extract_text_from_pdf(file_bytes)
+            with profiler.section("GPT 요약/임베딩", cached=True):
+                summary, embedding = summarize_and_embed_with_gpt(title, text)
         else:
             summary, embedding = "(요약은 PDF 문서만 지원됩니다)", []
             text = ""
@@ -115,31 +82,19 @@ sort_order = st.radio("정렬 순서", ["내림차순", "오름차순"], horizon
 filtered_docs = st.session_state.documents.copy()
 
 if search:
-    filtered_docs = filtered_docs[filtered_docs.apply(
-        lambda r: search.lower() in r["제목"].lower() or search.lower() in r["업로더"].lower(), axis=1
-    )]
+    with profiler.section("키워드 검색", rows=len(filtered_docs)):
+        filtered_docs = keyword_filter(filtered_docs, search)
 
 if gpt_query:
     try:
         client = OpenAI(api_key=st.session_state.api_key)
-        query_emb = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=gpt_query
-        ).data[0].embedding
-
-        title_sims, content_sims = [], []
-        for _, row in filtered_docs.iterrows():
-            title_emb = client.embeddings.create(
-                model="text-embedding-3-small",
-                input=row["제목"]
-            ).data[0].embedding
-            title_sim = cosine_similarity([query_emb], [title_emb])[0][0] if title_emb else 0.0
-            content_sim = cosine_similarity([query_emb], [row["임베딩"]])[0][0] if row["임베딩"] else 0.0
-            title_sims.append(title_sim)
-            content_sims.append(content_sim)
-
-        filtered_docs["제목 유사도"] = title_sims
-        filtered_docs["본문 유사도"] = content_sims
+        # 검색어와 제목 임베딩은 프로세스 공용 캐시에 없는 것만 한 번에 요청
+        titles = filtered_docs["제목"].tolist()
+        with profiler.section("검색어/제목 임베딩", rows=len(titles) + 1, cached=True):
+            query_emb, *title_embs = get_embedding_cache().get_many(client, [gpt_query] + titles)
+        with profiler.section("유사도 계산", rows=len(filtered_docs)):
+            title_sims = similarity(query_emb, title_embs)
+            content_sims = similarity(query_emb, filtered_docs["임베딩"].tolist())
 
         colw1, colw2 = st.columns(2)
         with colw1:
@@ -147,15 +102,13 @@ if gpt_query:
         with colw2:
             st.caption(f"본문 유사도 가중치: {1 - w_title:.2f}")
 
-        filtered_docs["종합 유사도"] = w_title * filtered_docs["제목 유사도"] + (1 - w_title) * filtered_docs["본문 유사도"]
-        filtered_docs = filtered_docs.sort_values(by="종합 유사도", ascending=False)
+        filtered_docs = rank_documents(filtered_docs, title_sims, content_sims, w_title)
 
     except Exception as e:
         st.warning(f"GPT 검색 실패: {e}")
 else:
-    if ext_filter != "전체":
-        filtered_docs = filtered_docs[filtered_docs["파일명"].str.lower().str.endswith(ext_filter)]
-    filtered_docs = filtered_docs.sort_values(by=sort_by, ascending=(sort_order == "오름차순")).reset_index(drop=True)
+    with profiler.section("문서 정렬", rows=len(filtered_docs)):
+        filtered_docs = sort_documents(filtered_docs, ext_filter, sort_by, sort_order == "오름차순")
 
 st.markdown(f"**총 문서 수: {len(filtered_docs)}개**")
 if filtered_docs.empty:
@@ -185,3 +138,4 @@ else:
                     else:
                         st.warning("❗ '삭제'라고 입력해야 삭제됩니다.")
 
+render_debug_panel(profiler)
@@ -1,43 +1,39 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-from data import dummy_data
+from datetime import datetime, time, timedelta
+from core.profit import margin_rate as compute_margin_rate
+from core.resources import get_ledger_store, get_pending_queue
+from core.importer import import_movements
+from core.query import ledger_page
+from core.debug import page_profiler, render_debug_panel
 
 st.set_page_config(page_title="재고 입출고", layout="wide")
 st.title("📦 재고 입출고 등록")
+profiler = page_profiler("inventory")
 
 # -----------------------------
-# 세션 상태 초기화
+# 공용 원장 (모든 세션이 같은 재고를 봄)
 # -----------------------------
-if "inventory_logs" not in st.session_state:
-    st.session_state.inventory_logs = dummy_data.inventory_logs.copy()
+with profiler.section("원장 로드", cached=True):
+    ledger = get_ledger_store()
+    pending_queue = get_pending_queue()
 
 # -----------------------------
 # 재고/입고 정보 계산 함수
 # -----------------------------
 def get_available_items():
-    df = st.session_state.inventory_logs
-    if df.empty:
-        return {}
-
-    stock = df.groupby(["품목명", "구분"])["수량"].sum().unstack().fillna(0)
-    stock["재고"] = stock.get("입고", 0) - stock.get("출고", 0)
-    available = stock[stock["재고"] > 0]["재고"]
-    return available.to_dict()
+    return ledger.available_items()
 
 def get_latest_in_info(item_name):
-    df = st.session_state.inventory_logs
-    if df.empty:
+    latest = ledger.latest_receipt(item_name)
+    if latest is None:
         return 0, "정보 없음"
 
-    df_item = df[(df["품목명"] == item_name) & (df["구분"] == "입고")]
-    if df_item.empty:
-        return 0, "정보 없음"
-    
-    latest_row = df_item.sort_values("날짜", ascending=False).iloc[0]
-    return latest_row["입고단가"], latest_row["납품업체명"]
+    in_price, supplier, _ = latest
+    return in_price, supplier
 
-available_items = get_available_items()
+with profiler.section("재고 품목") as timing:
+    available_items = get_available_items()
+    timing["rows"] = len(available_items)
 
 # -----------------------------
 # UI 입력 영역
@@ -83,8 +79,9 @@ with col2:
 # -----------------------------
 st.divider()
 margin_rate = None
-if inout_type == "출고" and in_price > 0 and out_price > 0:
-    margin_rate = round((out_price - in_price) / in_price * 100, 2)
+if inout_type == "출고":
+    margin_rate = compute_margin_rate(in_price, out_price)
+if margin_rate is not None:
     st.success(f"💹 실시간 마진율: `{margin_rate}%`")
 elif inout_type == "출고":
     st.info("마진율을 계산하려면 입고/출고 단가 모두 입력해야 합니다.")
@@ -120,22 +117,181 @@ if st.button("✅ 등록"):
             "비고": remark
         }
 
-        st.session_state.inventory_logs = pd.concat(
-            [st.session_state.inventory_logs, pd.DataFrame([new_log])],
-            ignore_index=True
-        )
+        with profiler.section("입출고 등록", rows=1):
+            ledger.append(new_log)
 
         st.success(f"✅ {inout_type} 등록 완료: {item_name} {int(quantity)}개")
 
 # -----------------------------
-# 입출고 내역 테이블
+# 입출고 대기 (발주 입고 예정 / 수주 출고 예약)
 # -----------------------------
-st.subheader("📋 입출고 내역")
+st.subheader("⏳ 입출고 대기")
 
-if st.session_state.inventory_logs.empty:
-    st.info("입출고 내역이 아직 없습니다.")
+pending_counts = pending_queue.counts()
+st.caption(f"입고 대기 {pending_counts['입고']}건 · 출고 대기 {pending_counts['출고']}건")
+
+with st.expander("➕ 대기 건 추가"):
+    with st.form("pending_form", clear_on_submit=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            pending_kind = st.selectbox("구분", ["입고", "출고"], key="pending_kind")
+            pending_item = st.text_input("품목명", key="pending_item")
+            pending_qty = st.number_input("수량", min_value=1, step=1, key="pending_qty")
+            pending_price = st.number_input("단가 (입고 예정 단가 / 출고 단가)", min_value=0, step=100, key="pending_price")
+        with col2:
+            pending_partner = st.text_input("거래처", key="pending_partner")
+            pending_manager = st.text_input("담당자", key="pending_manager")
+            pending_due = st.date_input("예정일", key="pending_due")
+            pending_ref = st.text_input("발주/수주 번호", placeholder="예: PO-2025-0701", key="pending_ref")
+
+        if st.form_submit_button("대기 등록"):
+            if not pending_item:
+                st.error("❌ 품목명을 입력하세요.")
+            else:
+                pending_queue.add(
+                    pending_kind, pending_item, pending_qty,
+                    in_price=pending_price if pending_kind == "입고" else 0,
+                    out_price=pending_price if pending_kind == "출고" else 0,
+                    partner=pending_partner, manager=pending_manager,
+                    due_date=pending_due, reference=pending_ref
+                )
+                st.success(f"✅ {pending_kind} 대기 등록: {pending_item} {int(pending_qty)}개")
+
+with profiler.section("대기 목록") as timing:
+    pending_df = pending_queue.entries()
+    timing["rows"] = len(pending_df)
+if pending_df.empty:
+    st.info("대기 중인 입출고가 없습니다.")
 else:
+    for _, entry in pending_df.iterrows():
+        col1, col2, col3 = st.columns([6, 1, 1])
+        with col1:
+            st.write(
+                f"**[{entry['kind']}]** {entry['item']} {entry['quantity']}개 · {entry['partner'] or '-'} · "
+                f"예정일 {entry['due_date'] or '-'} · {entry['reference'] or ''}"
+            )
+        with col2:
+            if st.button("확정", key=f"pending_confirm_{entry['id']}"):
+                try:
+                    pending_queue.confirm(entry["id"], ledger)
+                    st.rerun()
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+        with col3:
+            if st.button("취소", key=f"pending_cancel_{entry['id']}"):
+                pending_queue.cancel(entry["id"])
+                st.rerun()
+
+# -----------------------------
+# 일괄 등록 (CSV/XLSX)
+# -----------------------------
+st.subheader("📂 입출고 일괄 등록")
+
+with st.expander("CSV/XLSX 파일로 여러 건 등록"):
+    st.caption("필수 컬럼: 날짜, 품목명, 구분, 수량 | 선택 컬럼: 입고단가, 예상출고단가, 출고단가, 납품업체명, 담당자명, 비고")
+    bulk_file = st.file_uploader("입출고 파일 선택", type=["csv", "xlsx"], key="bulk_file")
+
+    if bulk_file is not None and st.button("📥 일괄 등록"):
+        try:
+            with profiler.section("일괄 등록 검증") as timing:
+                accepted, rejected = import_movements(
+                    bulk_file, bulk_file.name, ledger.stock_as_of, ledger.movements_after, ledger.receipt_history()
+                )
+                timing["rows"] = len(accepted) + len(rejected)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+        else:
+            with profiler.section("일괄 등록 저장", rows=len(accepted)):
+                ledger.append_many(accepted)
+            st.success(f"✅ 일괄 등록 완료: {len(accepted)}건")
+            if not rejected.empty:
+                st.warning(f"⚠️ 등록되지 않은 행: {len(rejected)}건")
+                st.dataframe(rejected, use_container_width=True)
+                st.download_button(
+                    "⬇️ 거부 내역 다운로드",
+                    rejected.to_csv(index=False).encode("utf-8-sig"),
+                    file_name="rejected_rows.csv",
+                    mime="text/csv"
+                )
+
+# -----------------------------
+# 기준일 재고 조회
+# -----------------------------
+st.subheader("🗓️ 기준일 재고 조회")
+
+with profiler.section("기준일 재고 인덱스", cached=True):
+    asof_index = ledger.asof_index()
+col1, col2 = st.columns(2)
+with col1:
+    asof_date = st.date_input("기준일", value=datetime.today())
+with col2:
+    asof_item = st.selectbox("품목", ["전체"] + asof_index.items())
+
+asof_time = datetime.combine(asof_date, time.max)
+if asof_item == "전체":
+    asof_stock = asof_index.all_as_of(asof_time)
     st.dataframe(
-        st.session_state.inventory_logs.sort_values(by="날짜", ascending=False),
+        {"품목명": list(asof_stock), "재고": list(asof_stock.values())},
         use_container_width=True
     )
+else:
+    st.metric(f"📦 {asof_date} 기준 {asof_item} 재고", f"{asof_index.stock_as_of(asof_item, asof_time):,}개")
+
+# -----------------------------
+# 재고 평가 (원가층 기준)
+# -----------------------------
+st.subheader("💰 재고 평가 (선입선출)")
+
+with profiler.section("재고 평가", cached=True) as timing:
+    valuation = ledger.valuation()
+    timing["rows"] = len(valuation)
+st.dataframe(valuation, use_container_width=True)
+st.caption(f"총 재고 평가액: ₩{int(valuation['재고평가액'].sum()):,}")
+
+# -----------------------------
+# 입출고 내역 테이블
+# -----------------------------
+st.subheader("📋 입출고 내역")
+
+with profiler.section("원장 정규화", cached=True) as timing:
+    ledger_df = ledger.prepared()
+    timing["rows"] = len(ledger_df)
+if ledger_df.empty:
+    st.info("입출고 내역이 아직 없습니다.")
+else:
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        period = st.date_input(
+            "기간",
+            value=(ledger_df.index[0].date(), ledger_df.index[-1].date()),
+            key="log_period"
+        )
+    with col2:
+        log_items = st.multiselect("품목", sorted(ledger_df["품목명"].cat.categories), key="log_items")
+    with col3:
+        log_kinds = st.multiselect("구분", ["입고", "출고"], key="log_kinds")
+    with col4:
+        log_suppliers = st.multiselect("납품업체", sorted(ledger_df["납품업체명"].cat.categories), key="log_suppliers")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sort_by = st.selectbox("정렬 기준", ["날짜", "품목명", "수량", "입고단가", "출고단가", "납품업체명"], key="log_sort")
+    with col2:
+        ascending = st.radio("정렬 순서", ["내림차순", "오름차순"], horizontal=True, key="log_order") == "오름차순"
+    with col3:
+        page_size = st.selectbox("페이지당 행 수", [20, 50, 100, 200], index=1, key="log_page_size")
+    with col4:
+        page = st.number_input("페이지", min_value=1, step=1, key="log_page")
+
+    start, end = (period[0], period[-1]) if period else (None, None)
+    with profiler.section("입출고 내역 조회") as timing:
+        page_df, total, pages = ledger_page(
+            ledger_df, page=page, page_size=page_size, sort_by=sort_by, ascending=ascending,
+            start=start, end=None if end is None else end + timedelta(days=1),
+            items=log_items, kinds=log_kinds, suppliers=log_suppliers
+        )
+        timing["rows"] = total
+    st.dataframe(page_df, use_container_width=True)
+    st.caption(f"총 {total:,}건 · {min(page, pages)}/{pages} 페이지")
+
+render_debug_panel(profiler)